@@ -0,0 +1,191 @@
+"""Time the path and grid helpers across grid sizes, and each scene's construct.
+
+Usage: python path_symmetries/benchmark.py [--sizes 3-12] [--output FILE] [--compare BASELINE] [--no-scenes]
+
+Each helper is timed (best and median of ``--repeat`` runs) and its peak
+Python allocation measured with tracemalloc, in a separate run so the tracing
+overhead doesn't count towards the time. Each scene's ``construct`` runs at
+low quality with animations skipped, nothing drawn and nothing written, so
+only the scene logic is measured. Results are written as JSON; ``--compare`` checks them
+against an earlier run and exits non-zero if anything has slowed past
+``--threshold``.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+from manim import __version__ as manim_version
+from manim import tempconfig
+
+import core
+from core.counting import count_paths
+from core.scene_loader import PACKAGE_DIR, find_scenes, load_module
+from core.timeline import DRY_RUN_CONFIG, disable_rasterization
+
+SLEN = 2
+
+
+def measure(func, repeat=3, number=1):
+    """Return ``(best, median, peak_bytes)``: seconds per call and peak traced allocation of ``func()``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(times), statistics.median(times), peak
+
+
+def helper_benchmarks(helpers, grid_dims):
+    """Return ``{name: func}`` for the helpers at one grid size; each func does one unit of work."""
+    lgrid = helpers.create_grid(SLEN, grid_dims)
+    # Right along the bottom then up the side: every size has it, without enumerating
+    steps = grid_dims - 1
+    path = [(0, 0, 0)] + [(0, 1, 0)] * steps + [(1, 0, 0)] * steps + [(0, 0, 0)]
+    p1, p2 = lgrid.cell_center(0), lgrid.cell_center(1)
+    return {
+        "get_all_moves": lambda: helpers.get_all_moves(grid_dims),
+        "create_grid": lambda: helpers.create_grid(SLEN, grid_dims),
+        "animate_line": lambda: helpers.animate_line(lgrid, path, 0, slen=SLEN),
+        "offset_point": lambda: helpers.offset_point(p1.copy(), p2, 0.35 * SLEN),
+    }
+
+
+# Calls per timing for helpers too fast to time one call at a time
+BATCH = {"animate_line": 20, "offset_point": 1000}
+
+
+def run_helpers(sizes, repeat=3, max_paths=10**6):
+    """Benchmark every helper at every size in ``sizes``; return the result entries."""
+    results = []
+    for grid_dims in sizes:
+        num_paths = count_paths(grid_dims)
+        for name, func in helper_benchmarks(core, grid_dims).items():
+            entry = {"benchmark": name, "grid_dims": grid_dims, "num_paths": num_paths}
+            if name == "get_all_moves" and num_paths > max_paths:
+                entry["status"] = "skipped"
+                entry["reason"] = f"{num_paths} paths exceeds --max-paths {max_paths}"
+            else:
+                best, median, peak = measure(func, repeat, BATCH.get(name, 1))
+                entry.update(status="ok", seconds=best, median_seconds=median, peak_bytes=peak)
+                if name == "animate_line":
+                    # What drawing every path one at a time would cost
+                    entry["all_paths_seconds"] = best * num_paths
+            results.append(entry)
+            print(_format(entry))
+    return results
+
+
+def run_construct(path, scene_name, repeat=1):
+    """Time one scene's ``construct`` with rasterization and file output disabled."""
+    entry = {"benchmark": "construct", "module": path.stem, "scene": scene_name}
+    scene_cls = getattr(load_module(path), scene_name)
+    settings = {**DRY_RUN_CONFIG, "quality": "low_quality", "input_file": str(path)}
+
+    def render():
+        with tempconfig(settings):
+            scene = scene_cls(skip_animations=True)
+            disable_rasterization(scene.renderer)
+            scene.render()
+
+    try:
+        best, median, peak = measure(render, repeat)
+        entry.update(status="ok", seconds=best, median_seconds=median, peak_bytes=peak)
+    except Exception as exc:
+        entry.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+    print(_format(entry))
+    return entry
+
+
+def _format(entry):
+    label = entry.get("scene") or f"{entry['benchmark']}[{entry['grid_dims']}]"
+    if entry["status"] != "ok":
+        return f"{entry['status']:>8}  {label}"
+    return f"{entry['seconds']:12.6f}s  {entry['peak_bytes'] / 2**20:9.2f} MiB  {label}"
+
+
+def _entry_key(entry):
+    return entry["benchmark"], entry.get("grid_dims"), entry.get("scene")
+
+
+def compare(results, baseline, threshold=1.25):
+    """Return the entries in ``results`` more than ``threshold`` times slower than in ``baseline``."""
+    previous = {_entry_key(e): e for e in baseline["results"] if e["status"] == "ok"}
+    regressions = []
+    for entry in results:
+        before = previous.get(_entry_key(entry))
+        if entry["status"] != "ok" or before is None or before["seconds"] <= 0:
+            continue
+        ratio = entry["seconds"] / before["seconds"]
+        if ratio > threshold:
+            regressions.append({**entry, "baseline_seconds": before["seconds"], "ratio": ratio})
+    return regressions
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PACKAGE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_sizes(text):
+    sizes = []
+    for part in text.split(","):
+        low, _, high = part.partition("-")
+        sizes.extend(range(int(low), int(high or low) + 1))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(range(3, 13)),
+                        help="grid sizes, e.g. 3-12 or 3,5,8 (default: 3-12)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("--max-paths", type=int, default=10**6,
+                        help="skip enumerating grids with more paths than this")
+    parser.add_argument("--no-scenes", action="store_true", help="skip the construct() benchmarks")
+    parser.add_argument("--output", default="benchmark.json", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="earlier results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio counted as a regression (default: 1.25)")
+    args = parser.parse_args()
+
+    results = run_helpers(args.sizes, repeat=args.repeat, max_paths=args.max_paths)
+    if not args.no_scenes:
+        results.extend(run_construct(path, name) for path, name in find_scenes())
+    summary = {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "manim": manim_version,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for entry in regressions:
+            print(f"REGRESSION {entry['ratio']:5.2f}x  {_format(entry)}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
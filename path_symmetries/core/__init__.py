@@ -0,0 +1,51 @@
+"""Shared path and grid helpers for the path_symmetries scenes.
+
+The path maths (enumeration, symmetry classes, counting, geometry, colour ramps) needs only
+NumPy and is imported eagerly. Everything that builds manim objects is
+imported on first access, so ``import core`` stays fast for scripts that
+only need the maths.
+"""
+from importlib import import_module
+
+from .colors import color_ramp, ramp_colors, to_rgb
+from .counting import count_paths, count_paths_blocked, edge_usage, log_edge_usage, log_path_counts
+from .geometry import (
+    LANE_SPREAD_FRAC, OFFSET_FRAC, add_move, arc_lengths, edge_lanes, grid_path_polylines, length_proportion,
+    offset_point, overlay_polylines, path_cells, path_polylines,
+)
+from .lattice_paths import (
+    COL_STEP, NO_STEP, ROW_STEP, get_all_moves, iter_moves, iter_moves_blocked, iter_step_bits, rank_moves,
+    reachable_cells, sample_moves, sample_ranks, unrank_moves,
+)
+from .registry import GridEntry, SceneRegistry
+from .schedule import PathSchedule, schedule_paths, slot_durations
+from .symmetry import canonical_moves, count_orbits, iter_orbit_representatives, orbit_size, path_images
+
+# Public names that need manim, and the submodule each one lives in
+_LAZY = {
+    "DrawPath": "animations",
+    "PathSweep": "animations",
+    "TracePolyline": "animations",
+    "animate_line": "builders",
+    "create_grid": "builders",
+    "get_unique_color": "builders",
+    "overlay_paths": "builders",
+    "EdgeHeatmap": "mobjects",
+    "LatticeGrid": "mobjects",
+    "PathCounter": "mobjects",
+    "PathOverlay": "mobjects",
+    "PathPolyline": "mobjects",
+    "level_of_detail": "mobjects",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
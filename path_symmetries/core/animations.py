@@ -0,0 +1,154 @@
+"""Animations for drawing lattice paths."""
+import numpy as np
+from manim import Animation, Create, VGroup, VMobject, linear, smooth
+
+from .geometry import arc_lengths, length_proportion
+from .mobjects import PathPolyline
+
+
+class DrawPath(Create):
+    """Create a ``PathPolyline`` at constant speed along its whole length."""
+
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        submobject.pointwise_become_partial(
+            starting_submobject, 0, starting_submobject.proportion_from_length(alpha)
+        )
+
+
+class TracePolyline(Animation):
+    """Trace a polyline from its first corner at constant speed, growing ``mobject`` along it.
+
+    The whole polyline's Bézier points and arc length table are built once.
+    Each frame finds the segment holding the tip by binary search and takes
+    the points up to it with ``pointwise_become_partial``: one array slice
+    and one split curve, with no per-corner Python work.
+
+    Parameters
+    ----------
+    mobject
+        The ``VMobject`` whose points are replaced by the traced part. A
+        ``PathPolyline`` (e.g. from ``animate_line``) brings its own corners
+        and length table.
+    corners
+        The polyline's corners, shape (n, 3). Defaults to the mobject's own
+        ``corners``, or else its anchors.
+    """
+
+    def __init__(self, mobject, corners=None, **kwargs):
+        lengths = None
+        if corners is None and isinstance(mobject, PathPolyline):
+            corners, lengths = mobject.corners, mobject.cumulative_lengths
+        elif corners is None:
+            corners = np.vstack([mobject.get_start_anchors(), mobject.get_end_anchors()[-1:]])
+        self.corners = np.asarray(corners, dtype=float)
+        self.lengths = arc_lengths(self.corners) if lengths is None else lengths
+        # One straight cubic per segment, so curve i is segment i
+        self.polyline = VMobject().set_points_as_corners(self.corners)
+        super().__init__(mobject, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        length = self.rate_func(alpha) * self.lengths[-1]
+        self.mobject.pointwise_become_partial(self.polyline, 0, length_proportion(self.lengths, length))
+
+
+class PathSweep(Animation):
+    """Draw then fade out each of a sequence of paths, all within one play.
+
+    Playing this once replaces a ``self.play(Create(line))`` /
+    ``self.play(FadeOut(line))`` pair per path, so render cost depends on
+    the number of frames rather than the number of plays.
+
+    Parameters
+    ----------
+    paths
+        The path mobjects, drawn in order (usually ``PathPolyline``). An item
+        may also be a list of paths, which are drawn and faded together, as
+        ``PathSchedule.groups`` gives for paths too short to get frames of
+        their own.
+    draw_time, fade_time
+        Seconds to draw and to fade out each item; either one value for every
+        item or one per item. Each phase is eased with ``smooth``, like
+        ``Create`` and ``FadeOut``.
+    colors
+        Optional stroke colour for each item.
+    counter
+        Optional object with ``set_value`` (e.g. an ``Integer``), set when
+        item ``i`` starts drawing to ``counts[i]``, or ``i + 1`` if ``counts``
+        is omitted.
+    counts
+        Optional running path count to show for each item, e.g.
+        ``PathSchedule.counts``.
+    """
+
+    def __init__(self, paths, draw_time=0.3, fade_time=0.2, colors=None, counter=None,
+                 counts=None, rate_func=linear, **kwargs):
+        self.paths = [VGroup(*path) if isinstance(path, (list, tuple)) else path for path in paths]
+        self.counts = counts
+        if colors is not None:
+            for path, color in zip(self.paths, colors):
+                path.set_stroke(color=color)
+        num_paths = len(self.paths)
+        durations = np.column_stack([
+            np.broadcast_to(np.asarray(draw_time, dtype=float), (num_paths,)),
+            np.broadcast_to(np.asarray(fade_time, dtype=float), (num_paths,)),
+        ]).ravel()
+        # Draw and fade phases alternate: phase 2i draws path i, phase 2i + 1 fades it
+        self.phase_ends = np.cumsum(durations)
+        self.phase_starts = self.phase_ends - durations
+        self.counter = counter
+        self.active_index = None
+        self.parts = None
+        self.opacities = [path.get_stroke_opacity() for path in self.paths]
+        super().__init__(
+            VGroup(*self.paths),
+            run_time=float(self.phase_ends[-1]) if num_paths else 0,
+            rate_func=rate_func,
+            introducer=True,
+            remover=True,
+            **kwargs,
+        )
+
+    def interpolate_mobject(self, alpha):
+        if not self.paths:
+            return
+        t = alpha * self.phase_ends[-1]
+        phase = min(int(np.searchsorted(self.phase_ends, t, side="right")), len(self.phase_ends) - 1)
+        index, fading = divmod(phase, 2)
+        if index != self.active_index:
+            self._activate(index)
+        duration = self.phase_ends[phase] - self.phase_starts[phase]
+        local_alpha = smooth((t - self.phase_starts[phase]) / duration) if duration > 0 else 1.0
+        path = self.paths[index]
+        if fading:
+            for part, start_part in self.parts[index]:
+                part.set_points(start_part.points)
+            path.set_stroke(opacity=self.opacities[index] * (1 - local_alpha))
+            return
+        for part, start_part in self.parts[index]:
+            if hasattr(start_part, "proportion_from_length"):
+                part.pointwise_become_partial(start_part, 0, start_part.proportion_from_length(local_alpha))
+            else:
+                part.pointwise_become_partial(start_part, 0, local_alpha)
+
+    def _activate(self, index):
+        """Empty every path except ``index``; only the outgoing and incoming paths change.
+
+        Inactive paths have no points, so each frame draws just the active
+        one. Its points come back from ``starting_mobject`` as it is drawn.
+        """
+        if self.active_index is None:
+            # (part, starting part) pairs of each path, matched while every path still has points
+            self.parts = [
+                list(zip(path.family_members_with_points(), start.family_members_with_points()))
+                for path, start in zip(self.paths, self.starting_mobject.submobjects)
+            ]
+            inactive = range(len(self.paths))
+        else:
+            inactive = [self.active_index]
+        for i in inactive:
+            for part, _ in self.parts[i]:
+                part.clear_points()
+        self.paths[index].set_stroke(opacity=self.opacities[index])
+        self.active_index = index
+        if self.counter is not None:
+            self.counter.set_value(index + 1 if self.counts is None else int(self.counts[index]))
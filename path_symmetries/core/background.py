@@ -0,0 +1,111 @@
+"""Draw a scene's unchanging mobjects once, as the camera background.
+
+In a long loop of path plays, the grids and labels are redrawn on every
+frame of every play; manim's own static-frame cache only lasts one play.
+Inside ``static_background`` they are rasterized once into the camera's
+background and taken out of the scene, so each frame draws only the paths
+and counters on top. Before every play the background is checked against a
+fingerprint of the camera frame and the static mobjects, and re-rasterized
+if either has changed. A play that animates the camera frame or a static
+mobject is drawn normally, with the static mobjects put back for it.
+
+While animations are skipped (dry runs, cached sections) nothing is drawn,
+so the static mobjects are left in the scene and never rasterized.
+"""
+from contextlib import contextmanager
+
+from manim.animation.animation import prepare_animation
+
+from .section_cache import camera_state, mobjects_digest
+
+
+class StaticBackgroundMixin:
+    """Scene mixin adding ``static_background`` (Cairo renderer)."""
+
+    static_mobjects = ()
+
+    @contextmanager
+    def static_background(self, *mobjects):
+        """Keep ``mobjects`` (default: everything on screen without updaters) in the background.
+
+        The static mobjects end up behind everything else in the block, as
+        the background is drawn first, and are put back at the back of the
+        scene afterwards. Does nothing while animations are skipped.
+        """
+        if self._skipping():
+            yield
+            return
+        if not mobjects:
+            mobjects = [mob for mob in self.mobjects if not mob.get_family_updaters()]
+        self.static_mobjects = list(mobjects)
+        self._default_background = self.camera.background
+        self._background_key = None
+        try:
+            self._hide_static()
+            yield
+        finally:
+            self._show_static()
+            self.static_mobjects = ()
+
+    def _skipping(self):
+        """Return whether plays are being skipped, by the scene or by the current section.
+
+        ``renderer.skip_animations`` itself is only brought up to date inside
+        ``play``, so it can't tell yet whether a new section is skipped.
+        """
+        renderer = self.renderer
+        sections = renderer.file_writer.sections
+        return renderer._original_skipping_status or bool(sections and sections[-1].skip_animations)
+
+    def _hide_static(self):
+        self.remove(*self.static_mobjects)
+        self._refresh_background()
+
+    def _show_static(self):
+        self.camera.background = self._default_background
+        self._background_key = None
+        self.add(*self.static_mobjects)
+        self.bring_to_back(*self.static_mobjects)
+
+    def _refresh_background(self):
+        """Re-rasterize the static mobjects if they or the camera frame have changed."""
+        if self._skipping():
+            return
+        for mob in self.static_mobjects:
+            mob.update(0)
+        key = (str(camera_state(self.camera)), mobjects_digest(self.static_mobjects))
+        if key == self._background_key:
+            return
+        camera = self.camera
+        camera.background = self._default_background
+        camera.reset()
+        camera.capture_mobjects(self.static_mobjects)
+        camera.set_background(camera.pixel_array.copy())
+        self._background_key = key
+
+    def _touches_background(self, animations):
+        """Return whether ``animations`` move the camera frame or any static mobject."""
+        watched = [*self.static_mobjects]
+        frame = getattr(self.camera, "frame", None)
+        if frame is not None:
+            watched.append(frame)
+        watched_ids = {id(part) for mob in watched for part in mob.get_family()}
+        return any(
+            animation.mobject is not None
+            and any(id(part) in watched_ids for part in animation.mobject.get_family())
+            for animation in animations
+        )
+
+    def play(self, *args, **kwargs):
+        if not self.static_mobjects:
+            return super().play(*args, **kwargs)
+        animations = [prepare_animation(arg) for arg in args]
+        # Skipped plays draw nothing, but still see the static mobjects in the scene
+        if self._skipping() or self._touches_background(animations):
+            self._show_static()
+            try:
+                return super().play(*animations, **kwargs)
+            finally:
+                self._hide_static()
+        self._refresh_background()
+        return super().play(*animations, **kwargs)
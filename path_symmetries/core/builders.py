@@ -0,0 +1,27 @@
+"""Manim-dependent builders shared by the scenes: grids, single paths, path overlays and path colours."""
+from manim import YELLOW, ManimColor
+
+from .colors import ramp_colors
+from .geometry import grid_path_polylines, overlay_polylines
+from .mobjects import LatticeGrid, PathOverlay, PathPolyline
+
+
+def create_grid(slen, grid_dims, num_cols=None):
+    """Create a grid with given cell side length and dimensions (square if ``num_cols`` is omitted)."""
+    return LatticeGrid(slen, grid_dims, num_cols)
+
+
+def animate_line(lgrid, moves, snode=None, COLOUR=YELLOW, slen=2):
+    """Return the offset polyline of ``moves`` through ``lgrid``'s cached cell centres."""
+    offset_points = grid_path_polylines([moves], lgrid.cell_centers, slen)[0]
+    return PathPolyline(offset_points, COLOUR)
+
+
+def overlay_paths(lgrid, paths, COLOUR=YELLOW, slen=2, stroke_width=4):
+    """Return every path in ``paths`` on ``lgrid`` at once, in lanes, as a single ``PathOverlay``."""
+    return PathOverlay(overlay_polylines(paths, lgrid.cell_centers, slen), COLOUR, stroke_width)
+
+
+def get_unique_color(base_colors, i, total):
+    """Return path ``i`` of ``total``'s colour, interpolated between rows of a ``color_ramp`` array."""
+    return ManimColor(ramp_colors(base_colors, i, total))
@@ -0,0 +1,50 @@
+"""Colour ramps for telling paths apart, computed with NumPy.
+
+Colours can be given as manim colours (anything with ``to_rgb``), hex strings
+or RGB float triples; ramps come back as ``(num_colors, 3)`` float arrays
+that can be wrapped in ``ManimColor`` row by row.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+def to_rgb(color):
+    """Return ``color`` as an RGB float array in [0, 1]."""
+    if hasattr(color, "to_rgb"):
+        return np.asarray(color.to_rgb(), dtype=float)
+    if isinstance(color, str):
+        hex_digits = color.lstrip("#")
+        return np.array([int(hex_digits[i:i + 2], 16) for i in (0, 2, 4)]) / 255
+    return np.asarray(color, dtype=float)[:3]
+
+
+@lru_cache(maxsize=None)
+def _ramp(start, end, num_colors):
+    alphas = np.linspace(0, 1, num_colors)[:, None]
+    rgbs = (1 - alphas) * np.array(start) + alphas * np.array(end)
+    # Shared between callers through the cache, so keep it read-only
+    rgbs.flags.writeable = False
+    return rgbs
+
+
+def color_ramp(start, end, num_colors):
+    """Return ``num_colors`` evenly spaced colours from ``start`` to ``end``, shape (num_colors, 3).
+
+    Ramps are cached, so every grid of the same size shares one array.
+    """
+    return _ramp(tuple(to_rgb(start)), tuple(to_rgb(end)), num_colors)
+
+
+def ramp_colors(rgbs, indices, total):
+    """Return the colour of item(s) ``indices`` out of ``total``, interpolating along ``rgbs``.
+
+    Vectorised form of ``get_unique_color``: ``indices`` may be a single index
+    (giving shape (3,)) or an array of them (giving shape (..., 3)).
+    """
+    rgbs = np.asarray(rgbs)
+    idx = np.asarray(indices) * (len(rgbs) - 1) / max(1, total - 1)
+    low = idx.astype(int)
+    high = np.minimum(low + 1, len(rgbs) - 1)
+    frac = (idx - low)[..., None]
+    return (1 - frac) * rgbs[low] + frac * rgbs[high]
@@ -0,0 +1,159 @@
+"""Vectorised geometry for whole sets of lattice paths.
+
+Cell coordinates follow ``animate_line``: a ``(1, 0, 0)`` move steps one row
+up the grid and a ``(0, 1, 0)`` move steps one column right, so grid cell
+``row * num_cols + col`` sits at ``origin + slen * (col, row, 0)``.
+"""
+import numpy as np
+
+# Fraction of a cell's side length that the first and last points are pulled
+# in from the S and G centres, so paths don't draw over the labels
+OFFSET_FRAC = 0.35
+
+# Reorders a (row, col, z) move into the (x, y, z) world direction it draws in
+_MOVE_TO_WORLD = [1, 0, 2]
+
+# Fraction of a cell's side length that the lanes of one edge spread across
+LANE_SPREAD_FRAC = 0.6
+
+
+def _unit(vectors):
+    """Normalise the last axis of ``vectors`` in the xy-plane."""
+    vectors = vectors.copy()
+    vectors[..., 2] = 0
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def add_move(curr, move):
+    """Return cell ``curr`` stepped by ``move``, as an ``(x, y, z)`` tuple."""
+    x, y, z = np.asarray(curr) + np.asarray(move)
+    return x, y, z
+
+
+def offset_point(p1, p2, amount):
+    """Return ``p1`` moved ``amount`` towards ``p2`` in the xy-plane."""
+    p1 = np.asarray(p1, dtype=float)
+    return p1 + amount * _unit(np.asarray(p2, dtype=float) - p1)
+
+
+def path_cells(paths):
+    """Return the (row, col, 0) cell of every S..G vertex, shape (num_paths, steps + 1, 3).
+
+    ``paths`` is a sequence of equal-length move lists in the zero-padded
+    format produced by ``get_all_moves``.
+    """
+    moves = np.asarray(paths, dtype=float)
+    if moves.ndim != 3 or moves.shape[1] < 3:
+        raise ValueError(f"Expected a batch of padded move lists, got shape {moves.shape}")
+    # Drop the trailing zero move; the leading one keeps S as the first vertex
+    return np.cumsum(moves[:, :-1], axis=1)
+
+
+def path_polylines(paths, origin, slen, offset_frac=OFFSET_FRAC):
+    """Return every path's offset polyline as one array of shape (num_paths, steps + 1, 3).
+
+    ``origin`` is the centre of the S cell and ``slen`` the cell side length.
+    The first point is pulled from S towards the second vertex and the last
+    from G towards the second-to-last, as ``animate_line`` does.
+    """
+    cells = path_cells(paths)
+    points = np.asarray(origin, dtype=float) + slen * cells[..., _MOVE_TO_WORLD]
+    return _offset_ends(points, slen * offset_frac)
+
+
+def grid_path_polylines(paths, cell_centers, slen, offset_frac=OFFSET_FRAC):
+    """Like ``path_polylines``, but look every vertex up in a grid's cached centres.
+
+    ``cell_centers`` is a ``LatticeGrid.cell_centers`` array indexed
+    ``[row, col]``, so the polylines follow the grid wherever it has been
+    moved or scaled to; ``slen`` should be its current cell side length.
+    """
+    cells = path_cells(paths).astype(int)
+    points = np.asarray(cell_centers)[cells[..., 0], cells[..., 1]]
+    return _offset_ends(points, slen * offset_frac)
+
+
+def _offset_ends(points, offset):
+    """Pull each polyline's first and last points ``offset`` along its first and last segments."""
+    points[:, 0] += offset * _unit(points[:, 1] - points[:, 0])
+    points[:, -1] += offset * _unit(points[:, -2] - points[:, -1])
+    return points
+
+
+def edge_lanes(paths, num_cols):
+    """Return ``(lanes, counts)`` for every step of every path, each of shape (num_paths, steps).
+
+    ``counts`` is how many of the paths take the same edge (same cell, same
+    direction) and ``lanes`` which of them this path is, numbered in path
+    order, all from one stable sort of the edge ids.
+    """
+    cells = path_cells(paths).astype(int)
+    moves = np.asarray(paths, dtype=int)[:, 1:-1]
+    # Edge id: the cell a step leaves from, and whether it is a column step
+    edge_ids = ((cells[:, :-1, 0] * num_cols + cells[:, :-1, 1]) * 2 + moves[..., 1]).ravel()
+    order = np.argsort(edge_ids, kind="stable")
+    sorted_ids = edge_ids[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(sorted_ids)])
+    lanes = np.empty_like(edge_ids)
+    lanes[order] = np.arange(len(sorted_ids)) - np.repeat(group_starts, group_sizes)
+    counts = np.empty_like(edge_ids)
+    counts[order] = np.repeat(group_sizes, group_sizes)
+    return lanes.reshape(moves.shape[:2]), counts.reshape(moves.shape[:2])
+
+
+def overlay_polylines(paths, cell_centers, slen, spread_frac=LANE_SPREAD_FRAC, offset_frac=OFFSET_FRAC):
+    """Like ``grid_path_polylines``, but with paths that share an edge moved into side-by-side lanes.
+
+    Each step is shifted along its edge's normal by its lane's offset, with
+    every edge's lanes centred on it and ``slen * spread_frac`` apart at the
+    busiest edge. A vertex between two perpendicular steps goes to
+    ``p + o1 * n1 + o2 * n2``, where the two offset lanes cross; between two
+    steps in the same direction the path jogs across from one lane to the
+    other. Interior vertices are therefore given as two points each (equal at
+    turns), for shape (num_paths, 2 * steps, 3). Computed for the whole path
+    set at once, so every path can be on screen together.
+    """
+    centers = np.asarray(cell_centers)
+    points = grid_path_polylines(paths, centers, slen, offset_frac)
+    cells = path_cells(paths).astype(int)
+    vertices = centers[cells[..., 0], cells[..., 1]]
+    directions = _unit(np.diff(vertices, axis=1))
+    # Left-hand normal of each step, in the grid's own plane
+    normals = np.stack([-directions[..., 1], directions[..., 0], np.zeros(directions.shape[:2])], axis=-1)
+    lanes, counts = edge_lanes(paths, centers.shape[1])
+    lane_width = slen * spread_frac / counts.max()
+    shifts = (lanes - (counts - 1) / 2)[..., None] * lane_width * normals
+
+    inner, shift_in, shift_out = points[:, 1:-1], shifts[:, :-1], shifts[:, 1:]
+    straight = np.all(np.isclose(directions[:, :-1], directions[:, 1:]), axis=-1, keepdims=True)
+    corners = inner + shift_in + shift_out
+    leave = np.where(straight, inner + shift_in, corners)
+    join = np.where(straight, inner + shift_out, corners)
+    interior = np.stack([leave, join], axis=2).reshape(len(points), -1, 3)
+    return np.concatenate([points[:, :1] + shifts[:, :1], interior, points[:, -1:] + shifts[:, -1:]], axis=1)
+
+
+def arc_lengths(corners):
+    """Return the arc length from the first corner to each corner of a polyline, shape (n,)."""
+    corners = np.asarray(corners, dtype=float)
+    return np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(corners, axis=0), axis=1))])
+
+
+def length_proportion(lengths, length):
+    """Return the proportion of a polyline's segments that its first ``length`` of arc length covers.
+
+    ``lengths`` is the polyline's ``arc_lengths`` table. ``pointwise_become_partial``
+    splits a VMobject evenly by curve, one per segment, so this is the
+    proportion to pass it to end at that arc length. The segment holding the
+    end point is found by binary search.
+    """
+    num_segments = len(lengths) - 1
+    if num_segments < 1 or lengths[-1] <= 0:
+        return 1.0
+    length = min(max(length, 0.0), lengths[-1])
+    # Number of corners at or before the end point, clamped to a real segment
+    reached = min(max(int(np.searchsorted(lengths, length, side="right")), 1), num_segments)
+    seg_start, seg_len = lengths[reached - 1], lengths[reached] - lengths[reached - 1]
+    t = (length - seg_start) / seg_len if seg_len > 0 else 0.0
+    return (reached - 1 + t) / num_segments
@@ -0,0 +1,210 @@
+"""Enumerate the monotone lattice paths between the S and G cells of a grid.
+
+A path on an ``m x n`` grid is ``m - 1`` row steps ``(1, 0, 0)`` and
+``n - 1`` column steps ``(0, 1, 0)`` in some order, padded with a ``(0, 0, 0)``
+move at each end, which is the move-list format ``animate_line`` expects.
+Paths are produced in the same lexicographic order that deduplicating
+``itertools.permutations`` gives (row steps before column steps), but only the
+C(m+n-2, m-1) unique orderings are ever generated. Grid sizes are given as
+``lgrid_dims`` rows and ``num_cols`` columns, square if ``num_cols`` is omitted.
+
+Grids with blocked cells are enumerated depth first by
+``iter_moves_blocked``, which only ever extends a path into cells that can
+still reach G.
+"""
+import random
+import sys
+from math import comb
+
+from .counting import count_paths
+
+NO_STEP = (0, 0, 0)
+ROW_STEP = (1, 0, 0)
+COL_STEP = (0, 1, 0)
+
+
+def _bits_to_moves(bits):
+    """Convert a 0/1 step sequence (0 = row step, 1 = column step) to a move list."""
+    return [NO_STEP] + [COL_STEP if bit else ROW_STEP for bit in bits] + [NO_STEP]
+
+
+def _moves_to_bits(moves):
+    """Convert a move list (with or without the zero padding) to a 0/1 step sequence."""
+    bits = []
+    for move in moves:
+        move = tuple(move)
+        if move == ROW_STEP:
+            bits.append(0)
+        elif move == COL_STEP:
+            bits.append(1)
+        elif move != NO_STEP:
+            raise ValueError(f"Not a unit lattice step: {move}")
+    return bits
+
+
+def iter_step_bits(num_rows, num_cols):
+    """Yield every sequence of ``num_rows`` zeros and ``num_cols`` ones in lexicographic order.
+
+    Each step to the next sequence is the classic next-permutation update, so
+    the work per sequence is linear in the path length.
+    """
+    bits = [0] * num_rows + [1] * num_cols
+    length = len(bits)
+    while True:
+        yield tuple(bits)
+        # Rightmost 0 that is followed by a 1
+        i = length - 2
+        while i >= 0 and bits[i] >= bits[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        # Rightmost 1 after it; swap them and put the tail back in ascending order
+        j = length - 1
+        while bits[j] <= bits[i]:
+            j -= 1
+        bits[i], bits[j] = bits[j], bits[i]
+        bits[i + 1:] = reversed(bits[i + 1:])
+
+
+def iter_moves(lgrid_dims, num_cols=None):
+    """Yield the move list of every unique S->G path on an ``lgrid_dims x num_cols`` grid."""
+    if num_cols is None:
+        num_cols = lgrid_dims
+    for bits in iter_step_bits(lgrid_dims - 1, num_cols - 1):
+        yield _bits_to_moves(bits)
+
+
+def reachable_cells(num_rows, num_cols, blocked=()):
+    """Return a ``[row][col]`` table of whether G can be reached from each cell avoiding ``blocked``.
+
+    ``blocked`` is an iterable of ``(row, col)`` cells; blocked cells are
+    never reachable. Filled in one backward pass from G.
+    """
+    blocked = {tuple(cell) for cell in blocked}
+    reach = [[False] * num_cols for _ in range(num_rows)]
+    for row in reversed(range(num_rows)):
+        for col in reversed(range(num_cols)):
+            if (row, col) in blocked:
+                continue
+            if row == num_rows - 1 and col == num_cols - 1:
+                reach[row][col] = True
+            else:
+                reach[row][col] = (
+                    (row + 1 < num_rows and reach[row + 1][col])
+                    or (col + 1 < num_cols and reach[row][col + 1])
+                )
+    return reach
+
+
+def iter_moves_blocked(num_rows, num_cols=None, blocked=()):
+    """Yield every S->G move list on a ``num_rows x num_cols`` grid that avoids ``blocked`` cells.
+
+    Paths come in the same lexicographic order as ``iter_moves``. The search
+    is depth first, and a step is only taken into a cell that can still
+    reach G, so every prefix it extends completes to at least one path and
+    no dead end is explored. Iterative, so path length isn't bounded by the
+    recursion limit.
+    """
+    if num_cols is None:
+        num_cols = num_rows
+    reach = reachable_cells(num_rows, num_cols, blocked)
+    if not reach[0][0]:
+        return
+    goal = (num_rows - 1, num_cols - 1)
+    cells = [(0, 0)]
+    bits = []
+    # Next step to try from each cell on the path: 0 = row, 1 = column, 2 = done
+    next_bit = [0]
+    while cells:
+        row, col = cells[-1]
+        if (row, col) == goal or next_bit[-1] > 1:
+            if (row, col) == goal:
+                yield _bits_to_moves(bits)
+            cells.pop()
+            next_bit.pop()
+            if bits:
+                bits.pop()
+            continue
+        bit = next_bit[-1]
+        next_bit[-1] += 1
+        row, col = (row + 1, col) if bit == 0 else (row, col + 1)
+        if row < num_rows and col < num_cols and reach[row][col]:
+            cells.append((row, col))
+            bits.append(bit)
+            next_bit.append(0)
+
+
+def get_all_moves(lgrid_dims, num_cols=None, blocked=()):
+    """Return every S->G move list on an ``lgrid_dims x num_cols`` grid, in lexicographic order.
+
+    With ``blocked`` cells, only the paths avoiding them are generated.
+    """
+    # Streamed rather than deduplicated from all (2n-2)! permutations of the moves
+    if blocked:
+        return list(iter_moves_blocked(lgrid_dims, num_cols, blocked))
+    return list(iter_moves(lgrid_dims, num_cols))
+
+
+def rank_moves(moves):
+    """Return the position of ``moves`` in the order produced by ``iter_moves``."""
+    bits = _moves_to_bits(moves)
+    rows_left = bits.count(0)
+    cols_left = len(bits) - rows_left
+    rank = 0
+    for bit in bits:
+        if bit:
+            # Skip every path that takes a row step here instead
+            if rows_left:
+                rank += comb(rows_left - 1 + cols_left, cols_left)
+            cols_left -= 1
+        else:
+            rows_left -= 1
+    return rank
+
+
+def unrank_moves(rank, lgrid_dims, num_cols=None):
+    """Return the move list at position ``rank`` of ``iter_moves(lgrid_dims, num_cols)``."""
+    rows_left = lgrid_dims - 1
+    cols_left = (lgrid_dims if num_cols is None else num_cols) - 1
+    total = comb(rows_left + cols_left, rows_left)
+    if not 0 <= rank < total:
+        raise IndexError(f"Path rank {rank} out of range for {total} paths")
+    bits = []
+    while rows_left and cols_left:
+        # Number of paths that take a row step next
+        row_first = comb(rows_left - 1 + cols_left, cols_left)
+        if rank < row_first:
+            bits.append(0)
+            rows_left -= 1
+        else:
+            rank -= row_first
+            bits.append(1)
+            cols_left -= 1
+    bits.extend([0] * rows_left + [1] * cols_left)
+    return _bits_to_moves(bits)
+
+
+def sample_ranks(k, total, seed=None):
+    """Return ``k`` distinct ranks drawn uniformly from ``range(total)``, sorted."""
+    if not 0 <= k <= total:
+        raise ValueError(f"Cannot sample {k} distinct paths from {total}")
+    rng = random.Random(seed)
+    if total <= sys.maxsize:
+        return sorted(rng.sample(range(total), k))
+    # range(total) has no len() past sys.maxsize; at these totals a repeat
+    # draw is vanishingly rare, so rejecting repeats costs nothing
+    ranks = set()
+    while len(ranks) < k:
+        ranks.add(rng.randrange(total))
+    return sorted(ranks)
+
+
+def sample_moves(k, lgrid_dims, num_cols=None, seed=None):
+    """Return ``k`` distinct S->G move lists drawn uniformly at random, in ``iter_moves`` order.
+
+    Each path is unranked from a uniformly drawn index, so nothing close to
+    the full path set is ever built, and the same ``seed`` always gives the
+    same sample.
+    """
+    total = count_paths(lgrid_dims, num_cols)
+    return [unrank_moves(rank, lgrid_dims, num_cols) for rank in sample_ranks(k, total, seed)]
@@ -0,0 +1,332 @@
+"""Mobjects for drawing lattice paths and grids."""
+from contextlib import contextmanager
+
+import numpy as np
+from manim import (
+    BLUE_E, DEFAULT_FONT_SIZE, DL, DR, UL, UR, WHITE, YELLOW, Integer, ManimColor, Rectangle, Square,
+    ValueTracker, VGroup, VMobject, straight_path,
+)
+
+from .colors import color_ramp
+from .counting import log_edge_usage
+from .geometry import arc_lengths, length_proportion
+
+
+def _segment_points(starts, ends):
+    """Return cubic Bézier points for straight segments ``starts[i] -> ends[i]``, one subpath each."""
+    thirds = np.linspace(0, 1, 4)[None, :, None]
+    return (starts[:, None] + thirds * (ends - starts)[:, None]).reshape(-1, 3)
+
+
+class PathPolyline(VMobject):
+    """A whole lattice path as a single VMobject through its offset corner points.
+
+    ``points`` is one row of ``path_polylines``: the offset start point, the
+    visited cell centres and the offset end point.
+    """
+
+    def __init__(self, points, color=YELLOW, stroke_width=8, **kwargs):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        self.corners = np.asarray(points, dtype=float)
+        self.set_points_as_corners(self.corners)
+        # Arc length at each corner, used to draw the path at constant speed
+        self.cumulative_lengths = arc_lengths(self.corners)
+
+    def proportion_from_length(self, fraction):
+        """Map a fraction of the path's arc length to the matching fraction of its curves.
+
+        ``pointwise_become_partial`` splits a VMobject evenly by curve, so the
+        shorter offset end segments would otherwise be drawn more slowly.
+        """
+        return length_proportion(self.cumulative_lengths, fraction * self.cumulative_lengths[-1])
+
+
+class PathOverlay(VMobject):
+    """Many lattice paths drawn at once as one VMobject with a subpath per path.
+
+    ``polylines`` is an ``overlay_polylines`` array, whose lane offsets keep
+    paths sharing an edge side by side. One stroke colour covers every path,
+    and hundreds of paths cost one mobject to draw.
+    """
+
+    def __init__(self, polylines, color=YELLOW, stroke_width=4, **kwargs):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        polylines = np.asarray(polylines, dtype=float)
+        starts = polylines[:, :-1].reshape(-1, 3)
+        ends = polylines[:, 1:].reshape(-1, 3)
+        # Drop the zero-length segments at each path's turns
+        keep = np.linalg.norm(ends - starts, axis=1) > 1e-9
+        self.set_points(_segment_points(starts[keep], ends[keep]))
+        self.num_paths = len(polylines)
+
+
+class LatticeCell:
+    """Lightweight stand-in for one cell of a ``LatticeGrid``.
+
+    Supports the ``grid[i].get_center()`` lookups the scenes used when grids
+    were VGroups of Squares, reading the centre from the grid's points.
+    """
+
+    def __init__(self, grid, index):
+        self.grid = grid
+        self.index = index
+
+    def get_center(self):
+        return self.grid.cell_center(self.index)
+
+
+class LatticeGrid(VMobject):
+    """A ``grid_dims x num_cols`` grid drawn as M+N+2 strokes in a single VMobject.
+
+    Cells are indexed ``row * num_cols + col`` like the Square VGroup built by
+    the old ``create_grid``, with cell 0 (S) centred on the origin and each
+    cell ``slen`` wide, so ``len(grid)`` and ``grid[i].get_center()`` behave
+    as before while the render cost grows with M+N rather than MN. The grid
+    is square if ``num_cols`` is omitted; ``grid_dims`` is the row count.
+    """
+
+    def __init__(self, slen, grid_dims, num_cols=None, color=WHITE, **kwargs):
+        super().__init__(color=color, **kwargs)
+        self.grid_dims = grid_dims
+        self.num_cols = grid_dims if num_cols is None else num_cols
+        # Whether level of detail has swapped the lattice for its outline
+        self.lod_outline = False
+        self.set_points(self._lattice_points(np.array([-slen / 2, -slen / 2, 0]), slen))
+
+    def _lattice_points(self, lower_left, slen):
+        """Return cubic Bézier points for every lattice line, one subpath per line."""
+        num_rows, num_cols = self.grid_dims, self.num_cols
+        starts = np.zeros((num_rows + num_cols + 2, 3))
+        ends = np.zeros_like(starts)
+        # Horizontal lines, then vertical lines
+        starts[:num_rows + 1, 1] = ends[:num_rows + 1, 1] = np.arange(num_rows + 1) * slen
+        ends[:num_rows + 1, 0] = num_cols * slen
+        starts[num_rows + 1:, 0] = ends[num_rows + 1:, 0] = np.arange(num_cols + 1) * slen
+        ends[num_rows + 1:, 1] = num_rows * slen
+        return _segment_points(starts + lower_left, ends + lower_left)
+
+    def __len__(self):
+        return self.grid_dims * self.num_cols
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [LatticeCell(self, i) for i in range(*index.indices(len(self)))]
+        return LatticeCell(self, range(len(self))[index])
+
+    def _cell_axes(self):
+        """Return the lattice's lower-left corner and the vectors across one column and one row.
+
+        Read from the grid's current points, so the cells follow however the
+        points were moved: directly, through a parent group or by ``.animate``.
+        """
+        points = self.points
+        num_rows, num_cols = self.grid_dims, self.num_cols
+        if self.lod_outline and len(points) == 16:
+            # Outline segments run DL -> DR -> UR -> UL -> DL
+            return points[0], (points[3] - points[0]) / num_cols, (points[7] - points[4]) / num_rows
+        if not self.lod_outline and len(points) == 4 * (num_rows + num_cols + 2):
+            # The first horizontal line runs along the bottom, the first vertical line up the left
+            left = 4 * (num_rows + 1)
+            return points[0], (points[3] - points[0]) / num_cols, (points[left + 3] - points[left]) / num_rows
+        # Points of another shape, e.g. part way through a Transform: use the bounding box
+        lower_left, upper_right = self.get_corner(DL), self.get_corner(UR)
+        width, height = (upper_right - lower_left)[:2]
+        return lower_left, np.array([width / num_cols, 0, 0]), np.array([0, height / num_rows, 0])
+
+    @property
+    def cell_centers(self):
+        """Centre of every cell as a ``[row, col]`` array, derived from the grid's points."""
+        origin, col_step, row_step = self._cell_axes()
+        rows, cols = np.mgrid[0:self.grid_dims, 0:self.num_cols]
+        return origin + (cols[..., None] + 0.5) * col_step + (rows[..., None] + 0.5) * row_step
+
+    def cell_center(self, index):
+        """Return the centre of cell ``index``."""
+        row, col = divmod(index, self.num_cols)
+        origin, col_step, row_step = self._cell_axes()
+        return origin + (col + 0.5) * col_step + (row + 0.5) * row_step
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if alpha >= 1 and isinstance(mobject2, LatticeGrid):
+            # The points are now the target's: adopt its size and whether it is an outline
+            self.grid_dims, self.num_cols = mobject2.grid_dims, mobject2.num_cols
+            self.lod_outline = mobject2.lod_outline
+        return self
+
+    def become(self, mobject, *args, **kwargs):
+        super().become(mobject, *args, **kwargs)
+        if isinstance(mobject, LatticeGrid):
+            self.grid_dims, self.num_cols = mobject.grid_dims, mobject.num_cols
+            self.lod_outline = mobject.lod_outline
+        return self
+
+    def cell_pixel_size(self, camera):
+        """Return how many pixels wide one cell is through ``camera``."""
+        frame = getattr(camera, "frame", None)
+        frame_width = frame.width if frame is not None else camera.frame_width
+        return self.width / self.num_cols * camera.pixel_width / frame_width
+
+    def show_outline(self, fill_opacity=0.15):
+        """Replace the lattice lines with the grid's outline and a faint fill."""
+        corners = np.array([self.get_corner(corner) for corner in (DL, DR, UR, UL, DL)])
+        self.set_points(_segment_points(corners[:-1], corners[1:]))
+        self.set_fill(self.get_stroke_color(), opacity=fill_opacity)
+        self.lod_outline = True
+        return self
+
+    def show_lattice(self):
+        """Restore the lattice lines, rebuilt to fill the grid's current bounding box."""
+        self.set_points(self._lattice_points(self.get_corner(DL), self.width / self.num_cols))
+        self.set_fill(opacity=0)
+        self.lod_outline = False
+        return self
+
+    def update_level_of_detail(self, camera, min_cell_pixels=6, hysteresis=1.5, fill_opacity=0.15):
+        """Show just the outline if cells are under ``min_cell_pixels`` wide through ``camera``.
+
+        The lattice comes back once cells are ``hysteresis`` times the
+        threshold, so a zoom hovering around it doesn't flicker between the two.
+        """
+        cell_pixels = self.cell_pixel_size(camera)
+        if not self.lod_outline and cell_pixels < min_cell_pixels:
+            self.show_outline(fill_opacity)
+        elif self.lod_outline and cell_pixels > min_cell_pixels * hysteresis:
+            self.show_lattice()
+        return self
+
+    def highlight_cell(self, index, color=YELLOW, opacity=0.5):
+        """Return a filled Square covering cell ``index``, e.g. to mark S or G."""
+        return Square(
+            side_length=self.width / self.num_cols,
+            stroke_width=0,
+            fill_color=color,
+            fill_opacity=opacity,
+        ).move_to(self.cell_center(index))
+
+
+@contextmanager
+def level_of_detail(scene, grids, **kwargs):
+    """Update the level of detail of ``grids`` every frame of the plays inside the block.
+
+    Wrap the plays that zoom the camera frame. The check runs as a scene
+    updater only for those plays: an updater on the grids would make the
+    scene redraw them, and everything after them, on every frame of every
+    play. ``kwargs`` go to ``LatticeGrid.update_level_of_detail``.
+    """
+    def update_detail(dt=0):
+        for grid in grids:
+            grid.update_level_of_detail(scene.camera, **kwargs)
+
+    update_detail()
+    scene.add_updater(update_detail)
+    try:
+        yield
+    finally:
+        scene.remove_updater(update_detail)
+        update_detail()
+
+
+class EdgeHeatmap(VGroup):
+    """How many S->G paths use each edge between neighbouring cells of a ``LatticeGrid``.
+
+    Edges are drawn between the grid's cell centres, coloured along a ramp
+    from ``colors[0]`` (fewest paths) to ``colors[1]`` (most) by the log of
+    their usage. Cairo strokes a VMobject in one colour, so the edges are
+    bucketed into ``num_levels`` colour levels, each drawn as one VMobject
+    with a subpath per edge: a 50x50 grid is still ``num_levels`` strokes.
+    """
+
+    def __init__(self, lgrid, num_levels=12, colors=(BLUE_E, YELLOW), stroke_width=6, **kwargs):
+        super().__init__(**kwargs)
+        row_edges, col_edges = log_edge_usage(lgrid.grid_dims, lgrid.num_cols)
+        centers = lgrid.cell_centers
+        starts = np.concatenate([centers[:-1, :].reshape(-1, 3), centers[:, :-1].reshape(-1, 3)])
+        ends = np.concatenate([centers[1:, :].reshape(-1, 3), centers[:, 1:].reshape(-1, 3)])
+        self.log_usage = np.concatenate([row_edges.ravel(), col_edges.ravel()])
+        if not len(self.log_usage):
+            return
+        low, high = self.log_usage.min(), self.log_usage.max()
+        scaled = (self.log_usage - low) / (high - low) if high > low else np.ones_like(self.log_usage)
+        levels = np.minimum((scaled * num_levels).astype(int), num_levels - 1)
+        for level, rgb in enumerate(color_ramp(colors[0], colors[1], num_levels)):
+            in_level = levels == level
+            if in_level.any():
+                bucket = VMobject(stroke_color=ManimColor(rgb), stroke_width=stroke_width)
+                bucket.set_points(_segment_points(starts[in_level], ends[in_level]))
+                self.add(bucket)
+
+
+class PathCounter(VMobject):
+    """Right-aligned integer display driven by a single ValueTracker.
+
+    Unlike ``Integer.set_value``, which rebuilds its digit mobjects, each
+    change copies pre-rendered 0-9 glyph points into a fixed row of digit
+    slots, so an update costs O(number of digits). The slots sit in an
+    invisible frame sized for ``num_digits``, which keeps the layout from
+    ``next_to`` stable as the count grows.
+    """
+
+    # digit character -> glyph points with the glyph's bottom centre at the origin
+    _glyph_atlas = None
+
+    def __init__(self, value=0, max_value=None, num_digits=None, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        if num_digits is None:
+            num_digits = len(str(max(value, max_value or 0)))
+        atlas = self.get_glyph_atlas()
+        glyph_width = max(np.ptp(points[:, 0]) for points in atlas.values())
+        glyph_height = max(np.ptp(points[:, 1]) for points in atlas.values())
+        # Same spacing Integer uses at the default font size
+        self.advance = glyph_width + 0.001 * DEFAULT_FONT_SIZE
+        self.frame = Rectangle(
+            width=num_digits * self.advance, height=glyph_height,
+            stroke_opacity=0, fill_opacity=0,
+        )
+        self.base_width = self.frame.width
+        # Filled and unstroked, like the glyphs Integer draws
+        self.slots = [VMobject(fill_opacity=1, stroke_width=0) for _ in range(num_digits)]
+        self.add(self.frame, *self.slots)
+        self.set_color(color)
+        self.tracker = ValueTracker(value)
+        self.shown_value = None
+        self.show_value(value)
+        self.add_updater(lambda m: m.show_value(m.tracker.get_value()))
+
+    @classmethod
+    def get_glyph_atlas(cls):
+        """Render the digits 0-9 once per process and cache their points."""
+        if cls._glyph_atlas is None:
+            atlas = {}
+            for digit in "0123456789":
+                glyph = Integer(int(digit))
+                points = np.concatenate([m.points for m in glyph.family_members_with_points()])
+                atlas[digit] = points - [glyph.get_center()[0], glyph.get_bottom()[1], 0]
+            cls._glyph_atlas = atlas
+        return cls._glyph_atlas
+
+    def get_value(self):
+        return int(round(self.tracker.get_value()))
+
+    def set_value(self, value):
+        self.tracker.set_value(value)
+        self.show_value(value)
+        return self
+
+    def show_value(self, value):
+        """Copy the glyphs for ``value`` into the slots, right-aligned in the frame."""
+        value = int(round(value))
+        if value == self.shown_value:
+            return self
+        self.shown_value = value
+        atlas = self.get_glyph_atlas()
+        scale = self.frame.width / self.base_width
+        right = self.frame.get_corner(DR)
+        digits = str(value)[::-1]
+        for k, slot in enumerate(reversed(self.slots)):
+            if k < len(digits):
+                offset = right - [(k + 0.5) * self.advance * scale, 0, 0]
+                slot.set_points(atlas[digits[k]] * scale + offset)
+            else:
+                slot.clear_points()
+        return self
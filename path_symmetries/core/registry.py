@@ -0,0 +1,83 @@
+"""Track the mobjects that belong to each grid in a scene.
+
+Scenes register each grid's label, counter, S/G markers and the paths
+currently drawn on it as they create them, then look them up by grid
+instead of scanning ``self.mobjects`` and matching on type and position.
+Lookups are by the grid object itself, so they cost the same however many
+mobjects the scene holds.
+"""
+from dataclasses import dataclass, field
+
+# Parts a grid can have registered, besides its paths
+ROLES = ("label", "counter", "start", "goal")
+
+
+@dataclass(eq=False)
+class GridEntry:
+    """The mobjects registered for one grid."""
+
+    grid: object
+    label: object = None
+    counter: object = None
+    start: object = None
+    goal: object = None
+    paths: list = field(default_factory=list)
+
+    def markers(self):
+        """Return the S and G markers that have been registered."""
+        return [mob for mob in (self.start, self.goal) if mob is not None]
+
+    def mobjects(self, include_grid=True):
+        """Return the grid (optionally) and everything registered for it."""
+        parts = [getattr(self, role) for role in ROLES]
+        mobs = [self.grid] if include_grid else []
+        return mobs + [mob for mob in parts if mob is not None] + self.paths
+
+    def take_paths(self):
+        """Return the registered paths and forget them, e.g. when fading them out."""
+        paths, self.paths = self.paths, []
+        return paths
+
+
+class SceneRegistry:
+    """Grid entries in the order they were registered, looked up by grid."""
+
+    def __init__(self):
+        self._entries = {}
+
+    def register(self, grid, **parts):
+        """Register ``grid`` (if new) and set any of its ``ROLES`` given as keywords; return its entry."""
+        unknown = set(parts) - set(ROLES) - {"paths"}
+        if unknown:
+            raise TypeError(f"Unknown grid parts: {', '.join(sorted(unknown))}")
+        entry = self._entries.get(id(grid))
+        if entry is None:
+            entry = self._entries[id(grid)] = GridEntry(grid)
+        for role, mob in parts.items():
+            setattr(entry, role, list(mob) if role == "paths" else mob)
+        return entry
+
+    def unregister(self, grid):
+        """Forget ``grid`` and return its entry."""
+        return self._entries.pop(id(grid))
+
+    def __getitem__(self, grid):
+        return self._entries[id(grid)]
+
+    def __contains__(self, grid):
+        return id(grid) in self._entries
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def grids(self):
+        """Return the registered grids in registration order."""
+        return [entry.grid for entry in self]
+
+    def parts(self, role, grids=None):
+        """Return the ``role`` mobject (e.g. ``"label"``) of each of ``grids`` (default: all) that has one."""
+        entries = self if grids is None else (self[grid] for grid in grids)
+        return [getattr(entry, role) for entry in entries if getattr(entry, role) is not None]
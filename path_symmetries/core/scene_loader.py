@@ -0,0 +1,36 @@
+"""Find and load the Scene classes defined in the path_symmetries scripts."""
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from manim import Scene
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_module(path):
+    """Import a scene script by path, the way the manim CLI does."""
+    path = Path(path).resolve()
+    # Scene scripts import core as a sibling package
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    module_name = path.stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scenes(package_dir=PACKAGE_DIR):
+    """Return ``(script path, scene class name)`` for every Scene subclass defined in ``package_dir``."""
+    scenes = []
+    for path in sorted(Path(package_dir).glob("*.py")):
+        module = load_module(path)
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, Scene) and obj.__module__ == module.__name__:
+                scenes.append((path, name))
+    return scenes
@@ -0,0 +1,71 @@
+"""Fit a sequence of per-path draw/fade animations into a fixed duration.
+
+``schedule_paths`` gives path ``i`` a slot of a geometric sequence of
+durations summing to the budget, so the sequence can speed up as it goes
+(``acceleration`` is how many times shorter the last slot is than the
+first). Slots shorter than ``min_frames`` frames can't show a draw and a
+fade, so consecutive short slots are merged until each group fills at least
+that many frames; the paths in a group are drawn and faded together and the
+counter jumps over the whole group. The render cost is then bounded by the
+budget in frames, whatever the number of paths.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class PathSchedule(NamedTuple):
+    """Slots of a path sequence: slot ``i`` shows paths ``bounds[i]:bounds[i + 1]``."""
+
+    bounds: np.ndarray
+    draw_times: np.ndarray
+    fade_times: np.ndarray
+
+    @property
+    def counts(self):
+        """Number of paths shown once each slot has started, for a path counter."""
+        return self.bounds[1:]
+
+    def groups(self, items):
+        """Split ``items`` (one per path) into a list per slot."""
+        return [list(items[start:stop]) for start, stop in zip(self.bounds[:-1], self.bounds[1:])]
+
+
+def slot_durations(num_paths, total_duration, acceleration=1.0):
+    """Return ``num_paths`` geometric slot durations summing to ``total_duration``.
+
+    The last slot is ``acceleration`` times shorter than the first; 1 gives
+    equal slots.
+    """
+    if num_paths == 0:
+        return np.zeros(0)
+    ratio = acceleration ** (-1 / (num_paths - 1)) if num_paths > 1 else 1.0
+    weights = ratio ** np.arange(num_paths)
+    return total_duration * weights / weights.sum()
+
+
+def schedule_paths(num_paths, total_duration, frame_rate, acceleration=1.0, fade_fraction=0.4,
+                   min_frames=2):
+    """Return the ``PathSchedule`` for ``num_paths`` paths played in ``total_duration`` seconds.
+
+    Each slot spends ``fade_fraction`` of its time fading out and the rest
+    drawing.
+    """
+    durations = slot_durations(num_paths, total_duration, acceleration)
+    min_slot = min_frames / frame_rate
+    bounds = [0]
+    slot_times = []
+    elapsed = 0.0
+    # Close a slot once the paths in it add up to at least min_slot
+    for index, ends_at in enumerate(np.cumsum(durations)):
+        if ends_at - elapsed >= min_slot or index == num_paths - 1:
+            if ends_at - elapsed < min_slot and slot_times:
+                # Too short a remainder at the end: fold it into the last slot
+                bounds[-1] = index + 1
+                slot_times[-1] += ends_at - elapsed
+            else:
+                bounds.append(index + 1)
+                slot_times.append(ends_at - elapsed)
+            elapsed = ends_at
+    slot_times = np.array(slot_times)
+    return PathSchedule(np.array(bounds), slot_times * (1 - fade_fraction), slot_times * fade_fraction)
@@ -0,0 +1,106 @@
+"""Reuse the encoded video of scene sections whose inputs have not changed.
+
+manim caches individual plays, but a long section such as the 5x5 path loop
+is many plays, and its hashes include the whole scene state. A cached
+section is keyed on what actually drives it: the inputs passed to
+``cached_section`` (grid dims, moves, colours, timings, ...), the camera
+frame and the mobjects already on screen on entry, and the output
+resolution/frame rate. On a hit, the section's
+plays still run to advance the scene state, but with rendering skipped, and
+the stored segment stands in for their video when the movie is combined.
+"""
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from manim import config
+
+
+def _jsonable(value):
+    """Convert section inputs (arrays, colours, nested sequences) into JSON-serialisable values."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "to_hex"):
+        return value.to_hex()
+    return repr(value)
+
+
+def section_key(name, inputs):
+    """Return a short content hash of a section's name and inputs."""
+    payload = json.dumps([name, _jsonable(inputs)], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def camera_state(camera):
+    """Return the camera frame's centre and size, which every frame it renders depends on."""
+    frame = getattr(camera, "frame", None)
+    if frame is not None:
+        return [frame.get_center(), frame.width, frame.height]
+    return [camera.frame_center, camera.frame_width, camera.frame_height]
+
+
+def mobjects_digest(mobjects):
+    """Return a hash of the points and colours of ``mobjects`` and their families."""
+    digest = hashlib.sha256()
+    for mob in mobjects:
+        for part in mob.get_family():
+            digest.update(type(part).__name__.encode())
+            digest.update(np.ascontiguousarray(part.points, dtype=float).tobytes())
+            for attr in ("stroke_rgbas", "fill_rgbas", "stroke_width"):
+                if hasattr(part, attr):
+                    digest.update(np.ascontiguousarray(getattr(part, attr), dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+class SectionCacheMixin:
+    """Scene mixin adding ``cached_section``.
+
+    Anything the section's body builds from outside state (helper functions,
+    module constants) must be passed in as an input; changes elsewhere will
+    not invalidate the cached segment.
+    """
+
+    @contextmanager
+    def cached_section(self, name, **inputs):
+        """Run the body as a named section, reusing its encoded video if its inputs are unchanged."""
+        file_writer = self.renderer.file_writer
+        key = section_key(name, {
+            **inputs,
+            "scene": type(self).__name__,
+            "camera": camera_state(self.camera),
+            "on_screen": mobjects_digest(self.mobjects),
+            "output": [config.pixel_width, config.pixel_height, config.frame_rate],
+        })
+        cache_dir = Path(config.get_dir("media_dir")) / "section_cache" / type(self).__name__
+        cached = sorted(cache_dir.glob(f"{name}-{key}.*"))
+
+        start = len(file_writer.partial_movie_files)
+        self.next_section(name, skip_animations=bool(cached))
+        yield
+        section = file_writer.sections[-1]
+        if cached:
+            # Skipped plays leave None placeholders, indexed by play number, so
+            # the segment takes the first slot rather than changing the count
+            if section.partial_movie_files:
+                section.partial_movie_files[0] = str(cached[0])
+                file_writer.partial_movie_files[start] = str(cached[0])
+        else:
+            rendered = section.get_clean_partial_movie_files()
+            if rendered:
+                segment = cache_dir / f"{name}-{key}{Path(rendered[0]).suffix}"
+                segment.parent.mkdir(parents=True, exist_ok=True)
+                # Newer manim encodes partial files in the background
+                if hasattr(file_writer, "join_all_encode_jobs"):
+                    file_writer.join_all_encode_jobs()
+                file_writer.combine_files(rendered, segment)
+        self.next_section()
@@ -0,0 +1,70 @@
+"""Enumerate lattice paths up to the symmetries of the square grid.
+
+The S-G diagonal and the 180-degree rotation map S->G paths onto S->G paths:
+reflecting across the diagonal swaps row and column steps, and rotating by
+180 degrees reverses the order of the steps. Together with their composition
+and the identity they form a group of order 4. Acting on 0/1 step sequences
+(0 = row step, 1 = column step):
+
+- ``swap``: flip every bit
+- ``reverse``: reverse the sequence
+- ``reverse_swap``: both
+
+Each orbit is represented by its lexicographically smallest member. Since a
+sequence and its swap differ in the first bit, every representative starts
+with a row step, so only half the sequences are ever generated.
+"""
+from math import comb
+
+from .lattice_paths import _bits_to_moves, _moves_to_bits, iter_step_bits
+
+
+def path_images(bits):
+    """Return the images of step sequence ``bits`` under the identity, swap, reverse and reverse-swap."""
+    bits = tuple(bits)
+    swapped = tuple(1 - bit for bit in bits)
+    return bits, swapped, bits[::-1], swapped[::-1]
+
+
+def orbit_size(bits):
+    """Return how many distinct paths the symmetries map ``bits`` to (1, 2 or 4)."""
+    return len(set(path_images(bits)))
+
+
+def canonical_moves(moves):
+    """Return the canonical representative of the orbit of move list ``moves``."""
+    return _bits_to_moves(min(path_images(_moves_to_bits(moves))))
+
+
+def iter_orbit_representatives(lgrid_dims):
+    """Yield ``(moves, orbit_size)`` for one representative path per symmetry class.
+
+    Representatives come in lexicographic order, and the orbit sizes sum to
+    ``count_paths(lgrid_dims)``.
+    """
+    steps = lgrid_dims - 1
+    if steps == 0:
+        yield _bits_to_moves(()), 1
+        return
+    for tail in iter_step_bits(steps - 1, steps):
+        bits = (0, *tail)
+        swapped = tuple(1 - bit for bit in bits)
+        reverse, reverse_swap = bits[::-1], swapped[::-1]
+        if bits <= reverse and bits <= reverse_swap:
+            yield _bits_to_moves(bits), len({bits, swapped, reverse, reverse_swap})
+
+
+def count_orbits(lgrid_dims):
+    """Return the number of path classes on an ``lgrid_dims`` grid, by Burnside's lemma.
+
+    The count is the average number of paths each symmetry fixes: every path
+    for the identity, none for the swap (it changes every step), the
+    palindromes for the reversal, and the sequences whose second half is the
+    flipped reverse of the first for reverse-swap.
+    """
+    steps = lgrid_dims - 1
+    fixed_identity = comb(2 * steps, steps)
+    fixed_swap = 1 if steps == 0 else 0
+    fixed_reverse = comb(steps, steps // 2) if steps % 2 == 0 else 0
+    fixed_reverse_swap = 2 ** steps
+    return (fixed_identity + fixed_swap + fixed_reverse + fixed_reverse_swap) // 4
@@ -0,0 +1,103 @@
+"""Compile a scene's Tex labels in parallel before ``construct`` runs.
+
+manim already caches every compiled label as an SVG under ``tex_dir``, named
+by a hash of the full .tex source (template preamble included), but it
+compiles them one at a time as ``construct`` reaches each ``Tex`` call.
+``prewarm_tex`` takes a manifest of the labels a scene will need, works out
+the SVG manim will look for each one under (from the same template the
+scene's ``Tex`` call uses), and compiles the missing ones across a process
+pool. The ``Tex`` calls in ``construct`` are then all cache hits.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from manim import MathTex, Tex, config
+from manim.utils.tex_file_writing import delete_nonsvg_files, generate_tex_file
+
+MATHDOTS_PREAMBLE = (r"\usepackage{mathdots}",)
+
+
+class TexLabel(NamedTuple):
+    """One label a scene will typeset: ``kind`` is ``"Tex"`` or ``"MathTex"``."""
+
+    kind: str
+    text: str
+    preamble: tuple = ()
+
+    def template(self):
+        """Return the TexTemplate the scene typesets this label with."""
+        return make_tex_template(self.preamble)
+
+    def svg_path(self, template=None):
+        """Return the SVG manim caches this label as, named by the hash of its .tex source.
+
+        Writes the .tex file if it is missing, as manim would. ``Tex``
+        typesets in a ``center`` environment and ``MathTex`` in ``align*``;
+        manim's other rewrites of the text only touch fragments like a bare
+        ``\\over``, never whole labels.
+        """
+        template = self.template() if template is None else template
+        environment = "center" if self.kind == "Tex" else "align*"
+        return generate_tex_file(self.text.strip(), environment, template).with_suffix(".svg")
+
+
+def tex_labels(*texts, kind="Tex", preamble=()):
+    """Build a manifest entry for each of ``texts``."""
+    return tuple(TexLabel(kind, text, tuple(preamble)) for text in texts)
+
+
+# Integer and DecimalNumber typeset each character as its own MathTex
+DIGIT_LABELS = tex_labels(*"0123456789", kind="MathTex")
+
+
+def make_tex_template(preamble=()):
+    """Return the configured TexTemplate, with ``preamble`` lines added to a copy if any are given."""
+    if not preamble:
+        return config.tex_template
+    template = config.tex_template.copy()
+    for line in preamble:
+        template.add_to_preamble(line)
+    return template
+
+
+def _init_worker(tex_dir):
+    config.tex_dir = tex_dir
+    # Workers share tex_dir, so one worker's cleanup would delete another's .dvi
+    config.no_latex_cleanup = True
+
+
+def _compile_label(label, template):
+    mob_class = Tex if label.kind == "Tex" else MathTex
+    mob_class(label.text, tex_template=template)
+
+
+def prewarm_tex(labels, max_workers=None):
+    """Compile every label in ``labels`` whose SVG isn't in ``tex_dir``; return how many were compiled."""
+    tex_dir = config.get_dir("tex_dir")
+    # Labels that share a .tex source compile once
+    pending = {}
+    for label in labels:
+        template = label.template()
+        svg_file = label.svg_path(template)
+        if not svg_file.exists():
+            pending.setdefault(svg_file, (label, template))
+    if not pending:
+        return 0
+    # Templates go to the workers with the labels, so settings made after
+    # startup (not just manim.cfg) apply there too
+    labels, templates = zip(*pending.values())
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(str(tex_dir),)) as pool:
+        list(pool.map(_compile_label, labels, templates))
+    if not config.no_latex_cleanup:
+        delete_nonsvg_files()
+    return len(pending)
+
+
+class TexPrewarmMixin:
+    """Scene mixin that prewarms ``tex_manifest`` in ``setup``, before ``construct``."""
+
+    tex_manifest = ()
+
+    def setup(self):
+        super().setup()
+        prewarm_tex(self.tex_manifest)
@@ -0,0 +1,129 @@
+"""Record a scene's plays as structured timeline data instead of rendering them.
+
+``TimelineRecorderMixin`` wraps ``Scene.play`` (``wait`` goes through it
+too) and appends one entry per call: the animations played, their run
+times, the scene time span, the camera frame and the bounding box of every
+mobject on screen once the play has finished. ``record_timeline`` runs a
+scene with animations skipped, all file output disabled and the renderer's
+drawing switched off by ``disable_rasterization``, so ``construct`` executes
+in full but no frame is ever rasterized.
+"""
+from manim import DL, UR, Wait, tempconfig
+
+# Settings that make rendering a scene a pure run of its construct()
+DRY_RUN_CONFIG = {
+    "dry_run": True,
+    "disable_caching": True,
+    "preview": False,
+    "progress_bar": "none",
+}
+
+
+def disable_rasterization(renderer):
+    """Stop a Cairo ``renderer`` from drawing anything while its scene runs.
+
+    Skipping animations isn't enough: every play still paints its static
+    mobjects into a saved frame, and frozen-frame waits paint the rest. Both
+    go through ``update_frame`` and ``save_static_frame_data``, which become
+    no-ops. The camera's capture is replaced by a guard, so any other
+    drawing raises instead of silently costing time.
+    """
+    def no_frame(*args, **kwargs):
+        return None
+
+    def capture_guard(*args, **kwargs):
+        raise RuntimeError("The camera drew a frame while rasterization was disabled")
+
+    renderer.update_frame = no_frame
+    renderer.save_static_frame_data = no_frame
+    renderer.static_image = None
+    renderer.camera.capture_mobjects = capture_guard
+    return renderer
+
+
+def _xy(point):
+    return [round(float(v), 6) for v in point[:2]]
+
+
+def bounding_box(mob):
+    """Return ``[[xmin, ymin], [xmax, ymax]]`` of ``mob`` and its family, or None if it has no points."""
+    if not any(part.has_points() for part in mob.get_family()):
+        return None
+    return [_xy(mob.get_corner(DL)), _xy(mob.get_corner(UR))]
+
+
+class TimelineRecorderMixin:
+    """Scene mixin that appends an entry to ``self.timeline`` for every play and wait."""
+
+    def setup(self):
+        super().setup()
+        self.timeline = []
+        # Labels like "Tex#3" stay the same between runs, unlike id(); the
+        # mobjects are kept so their ids can't be reused by new ones
+        self._labels = {}
+
+    def mobject_label(self, mob):
+        """Return a stable label for ``mob``: its class name and the order it was first seen in."""
+        key = id(mob)
+        if key not in self._labels:
+            self._labels[key] = (f"{type(mob).__name__}#{len(self._labels)}", mob)
+        return self._labels[key][0]
+
+    def camera_frame(self):
+        """Return the camera frame's centre, width and height."""
+        frame = getattr(self.camera, "frame", None)
+        if frame is not None:
+            center, width, height = frame.get_center(), frame.width, frame.height
+        else:
+            center = self.camera.frame_center
+            width, height = self.camera.frame_width, self.camera.frame_height
+        return {"center": _xy(center), "width": round(float(width), 6), "height": round(float(height), 6)}
+
+    def describe_mobject(self, mob):
+        entry = {"id": self.mobject_label(mob), "type": type(mob).__name__, "bbox": bounding_box(mob)}
+        text = getattr(mob, "tex_string", None)
+        if text is not None:
+            entry["text"] = text
+        return entry
+
+    def play(self, *args, **kwargs):
+        start = self.renderer.time
+        super().play(*args, **kwargs)
+        animations = self.animations or []
+        is_wait = len(animations) == 1 and isinstance(animations[0], Wait)
+        self.timeline.append({
+            "index": len(self.timeline),
+            "kind": "wait" if is_wait else "play",
+            "start": round(start, 6),
+            "end": round(self.renderer.time, 6),
+            "animations": [] if is_wait else [
+                {
+                    "type": type(animation).__name__,
+                    "run_time": animation.run_time,
+                    "mobject": self.mobject_label(animation.mobject) if animation.mobject is not None else None,
+                }
+                for animation in animations
+            ],
+            "camera": self.camera_frame(),
+            "mobjects": [self.describe_mobject(mob) for mob in self.mobjects],
+        })
+
+
+def record_timeline(scene_cls, **config):
+    """Run ``scene_cls`` without rendering and return its timeline report.
+
+    ``config`` entries are added to the temporary manim config (e.g.
+    ``quality`` or ``input_file``).
+    """
+    # Same class name, so config-derived paths and logs match the real scene
+    recorder_cls = type(scene_cls.__name__, (TimelineRecorderMixin, scene_cls), {})
+    with tempconfig({**DRY_RUN_CONFIG, **config}):
+        scene = recorder_cls(skip_animations=True)
+        disable_rasterization(scene.renderer)
+        scene.render()
+    return {
+        "scene": scene_cls.__name__,
+        "duration": round(scene.renderer.time, 6),
+        "num_plays": len(scene.timeline),
+        "timeline": scene.timeline,
+    }
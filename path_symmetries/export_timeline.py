@@ -0,0 +1,47 @@
+"""Export each scene's play/wait timeline to JSON without rendering any frames.
+
+Usage: python path_symmetries/export_timeline.py [-o OUTPUT_DIR] [-q QUALITY] [SCENE ...]
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from manim.constants import QUALITIES
+
+from core.scene_loader import find_scenes, load_module
+from core.timeline import record_timeline
+
+
+def export_timeline(path, scene_name, output_dir, quality="low_quality"):
+    """Record one scene's timeline, write it to ``output_dir/<scene>.json`` and return the file path."""
+    scene_cls = getattr(load_module(path), scene_name)
+    report = record_timeline(scene_cls, quality=quality, input_file=str(path))
+    report["module"] = path.stem
+    output = Path(output_dir) / f"{scene_name}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    return output, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names to export (default: all)")
+    parser.add_argument("-o", "--output-dir", default="timelines", help="directory for the JSON files")
+    parser.add_argument("-q", "--quality", default="low_quality", choices=list(QUALITIES),
+                        help="manim quality preset, which sets the frame aspect ratio")
+    args = parser.parse_args()
+
+    for path, name in find_scenes():
+        if args.scenes and name not in args.scenes:
+            continue
+        start = time.perf_counter()
+        output, report = export_timeline(path, name, args.output_dir, args.quality)
+        print(f"{report['num_plays']:5d} plays  {report['duration']:8.2f}s scene time  "
+              f"({time.perf_counter() - start:.2f}s)  {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
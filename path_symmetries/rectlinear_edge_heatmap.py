@@ -0,0 +1,34 @@
+from manim import *
+
+from core.builders import create_grid
+from core.counting import count_paths
+from core.mobjects import EdgeHeatmap
+from core.tex_cache import TexPrewarmMixin, tex_labels
+
+class EdgeHeatmapScene2D(TexPrewarmMixin, MovingCameraScene):
+    tex_manifest = tex_labels("$S$", "$G$", "50$\\times$50")
+
+    def construct(self):
+        slen = 2
+        grid_dims = 50
+
+        # Far too many paths to draw one by one, so show how many use each edge
+        grid = create_grid(slen, grid_dims).set_stroke(width=1, opacity=0.4)
+        frame = self.camera.frame
+        frame.set(width=grid.width * 1.6).move_to(grid.get_center())
+        self.play(Create(grid), run_time=1)
+
+        label_scale = grid.width / 12
+        start_label = Tex("$S$").scale(label_scale).next_to(grid.get_corner(DL), DL, buff=0.2 * label_scale)
+        goal_label = Tex("$G$").scale(label_scale).next_to(grid.get_corner(UR), UR, buff=0.2 * label_scale)
+        grid_label = Tex("50$\\times$50").scale(label_scale).next_to(grid, UP, buff=0.5 * label_scale)
+        self.play(Write(start_label), Write(goal_label), Write(grid_label), run_time=0.8)
+
+        heatmap = EdgeHeatmap(grid, stroke_width=4)
+        self.play(FadeIn(heatmap), run_time=1.5)
+
+        # Exact count: the heatmap never enumerates a single path
+        number = Text(f"{count_paths(grid_dims):,} paths", color=BLUE_B).scale(label_scale / 2)
+        number.next_to(grid, DOWN, buff=0.5 * label_scale)
+        self.play(Write(number), run_time=1)
+        self.wait(2)
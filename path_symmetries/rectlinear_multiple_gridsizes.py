@@ -1,106 +1,44 @@
 from manim import *
-from itertools import permutations
-from manim.utils.color import interpolate_color
 
-def create_grid(slen, grid_dims):
-    """Create a square grid of squares with given side length and dimensions."""
-    return VGroup(*[
-        Square(side_length=slen).move_to(
-            np.array([
-                x * slen,
-                y * slen,
-                0
-            ])
-        )
-        for y in range(grid_dims)
-        for x in range(grid_dims)
-    ])
-
-
-# Convert moves to grid indices
-def add_move(curr, move):
-    x, y, z = curr + move
-    return x, y, z
-
-
-# Calculate direction vectors for offsetting
-def offset_point(p1, p2, amount):
-    direction = (p2 - p1)
-    direction[2] = 0
-    direction = direction / np.linalg.norm(direction)
-    return p1 + direction * amount
-
-
-def animate_line(lgrid, moves, snode, COLOUR=YELLOW, slen=2):
-    curr_pos = (0, 0, 0)
-    path_indices = []
-    grid_dims = int(np.sqrt(len(lgrid)))  # Assuming grid is square
-    for move in moves:
-        curr_pos = add_move(np.array(curr_pos), np.array(move))
-        x_idx, y_idx = int(curr_pos[1]), int(curr_pos[0])
-        idx =  y_idx * grid_dims + x_idx
-        path_indices.append(idx)
-    path_points = [lgrid[i].get_center() for i in path_indices]
-    
-    # Add snode.get_center() to all path_points
-    # for i in range(len(path_points)):
-    #     path_points[i] += snode.get_center()
-
-    # Offset amount (fraction of square side length)
-    offset_frac = 0.35
-    offset = slen * offset_frac
+from core.animations import PathSweep
+from core.background import StaticBackgroundMixin
+from core.builders import create_grid
+from core.colors import color_ramp
+from core.counting import count_paths
+from core.geometry import grid_path_polylines
+from core.lattice_paths import get_all_moves
+from core.mobjects import PathCounter, PathPolyline
+from core.schedule import schedule_paths
+from core.section_cache import SectionCacheMixin
+from core.tex_cache import DIGIT_LABELS, TexPrewarmMixin, tex_labels
+
+
+def path_sweep(lgrid, moves, number, duration, colors=(BLUE, RED), acceleration=1.0, fade_fraction=0.4,
+               min_frames=2, slen=2):
+    """Draw and fade every path in moves on lgrid within duration seconds, counting them on number.
+
+    The paths are coloured along a ramp between the two colors; the other
+    keywords go to schedule_paths.
+    """
+    # Offset polylines for every path, computed in one batch
+    polylines = grid_path_polylines(moves, lgrid.cell_centers, slen)
+    # One cached NumPy ramp gives every path its colour
+    ramp = color_ramp(*colors, len(moves))
+    lines = [PathPolyline(points, ManimColor(rgb)) for points, rgb in zip(polylines, ramp)]
+    # Paths too short for frames of their own are drawn together in shared slots
+    schedule = schedule_paths(len(lines), duration, config.frame_rate, acceleration, fade_fraction, min_frames)
+    return PathSweep(
+        schedule.groups(lines),
+        draw_time=schedule.draw_times,
+        fade_time=schedule.fade_times,
+        counter=number,
+        counts=schedule.counts,
+    )
+
+
+class MultipleGridsScene2D(StaticBackgroundMixin, SectionCacheMixin, TexPrewarmMixin, MovingCameraScene):
+    tex_manifest = tex_labels("$S$", "$G$", "3x3", "4x4", "5x5") + DIGIT_LABELS
 
-    # Offset the first point towards the second, and the last towards the second-to-last
-    offset_points = [offset_point(path_points[0], path_points[1], offset)]
-    for i in range(1, len(path_points) - 2):
-        offset_points.append(path_points[i])
-    offset_points.append(offset_point(path_points[-2], path_points[-3], offset))
-
-    # Create lines between consecutive offset points
-    lines = VGroup(*[
-        Line(offset_points[i], offset_points[i + 1], color=COLOUR, stroke_width=8)
-        for i in range(len(offset_points) - 1)
-    ])
-    return lines
-
-
-def get_all_moves(lgrid_dims):
-    # Define paths for all permutations of moves between S and G
-    # These paths iterate through every perumtation of adding x, y in range (0, 3)
-    moves = []
-    for _ in range(lgrid_dims * lgrid_dims):
-        moves.append([(0, 0, 0)])  # Each list is a distinct object
-    
-    move_steps = [(1, 0, 0)] * (lgrid_dims - 1) + [(0, 1, 0)] * (lgrid_dims - 1)
-    all_paths = list(permutations(move_steps))
-    moves.clear()
-    for path in all_paths:
-        moves.append([(0, 0, 0)] + list(path))
-    for move in moves:
-        move.append((0, 0, 0))
-    
-    # Remove duplicate paths from moves
-    unique_moves = []
-    seen = set()
-    for move in moves:
-        move_tuple = tuple(move)
-        if move_tuple not in seen:
-            unique_moves.append(move)
-            seen.add(move_tuple)
-    moves = unique_moves
-    return moves
-
-
-def get_unique_color(base_colors, i, total):
-            # Interpolate between base colors
-            idx = i * (len(base_colors) - 1) / max(1, total - 1)
-            low = int(idx)
-            high = min(low + 1, len(base_colors) - 1)
-            frac = idx - low
-            return interpolate_color(base_colors[low], base_colors[high], frac)
-   
-
-class MultipleGridsScene2D(MovingCameraScene):
     def construct(self):
         slen = 2
         grid = create_grid(slen, 3)
@@ -112,7 +50,7 @@ class MultipleGridsScene2D(MovingCameraScene):
         # Highlight that these symmetries scale with grid size
         # Zoom out and shift grid to the far left, keeping it vertically centered
         frame = self.camera.frame
-        grid_width = slen * int(np.sqrt(len(grid)))
+        grid_width = slen * grid.grid_dims
         frame_width = frame.get_width()
         
         spacing = frame_width * 0.9 / (num_grids)
@@ -179,50 +117,24 @@ class MultipleGridsScene2D(MovingCameraScene):
         # generate all moves for each grid
         moves2 = get_all_moves(4)
         moves3 = get_all_moves(5)
-
-        number = Integer(1, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
-        for i, move in enumerate(moves):
-            num_paths = len(moves)
-            start_node = grid[0]
-            goal_node = grid[-1]
-            number.add_updater(lambda m: m.set_value(i + 1))
-            self.add(number)
-            base_colors = [interpolate_color(BLUE, RED, alpha) for alpha in np.linspace(0, 1, num_paths)]
-            color = get_unique_color(base_colors, i, num_paths)
-            line = animate_line(grid, move, start_node, color)
-            self.play(Create(line), run_time=0.3)
-            self.play(FadeOut(line), run_time=0.2)
-        
-        digit_width = Integer(1).scale(2).get_width()
-        number = Integer(1, color=BLUE_B).scale(2).next_to(grid2, DOWN, buff=0.5)
-        for j, move in enumerate(moves2):
-            num_paths = len(moves2)
-            start_node = grid2[0]
-            goal_node = grid2[-1]
-            base_colors = [interpolate_color(BLUE, RED, alpha) for alpha in np.linspace(0, 1, num_paths)]
-            color = get_unique_color(base_colors, j, num_paths)
-            line = animate_line(grid2, move, start_node, color)
-            if j == 9:
-                number.add_updater(lambda m: m.set_value(j + 1)).shift([-digit_width/1.4, 0, 0])
-            else:
-                number.add_updater(lambda m: m.set_value(j + 1))
-            self.add(number)
-            self.play(Create(line), run_time=0.2)
-            self.play(FadeOut(line), run_time=0.15)
-            
-        digit_width = Integer(1).scale(2).get_width()
-        number = Integer(1, color=BLUE_B).scale(2).next_to(grid3, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
-        for k, move in enumerate(moves3):
-            num_paths = len(moves3)
-            start_node = grid3[0]
-            goal_node = grid3[-1]
-            base_colors = [interpolate_color(BLUE, RED, alpha) for alpha in np.linspace(0, 1, num_paths)]
-            color = get_unique_color(base_colors, k, num_paths)
-            line = animate_line(grid3, move, start_node, color)
-            number.add_updater(lambda m: m.set_value(k + 1))
-            self.add(number)
-            self.play(Create(line), run_time=0.15)
-            self.play(FadeOut(line), run_time=0.1)
-            
+        # Check the enumerations against the closed-form counts
+        for lgrid_dims, grid_moves in ((3, moves), (4, moves2), (5, moves3)):
+            assert len(grid_moves) == count_paths(lgrid_dims)
+
+        # Each grid's path loop is its own section, re-encoded only when its inputs change,
+        # so everything the sweep and counter are drawn with goes into the section key
+        sweep_style = dict(colors=(BLUE, RED), acceleration=1.0, fade_fraction=0.4, min_frames=2, slen=slen)
+        counter_color = BLUE_B
+        # Each grid gets a duration budget rather than fixed per-path timings
+        for name, lgrid, grid_moves, duration in (
+            ("grid_3x3", grid, moves, 3),
+            ("grid_4x4", grid2, moves2, 7),
+            ("grid_5x5", grid3, moves3, 17.5),
+        ):
+            with self.cached_section(name, moves=grid_moves, cells=lgrid.cell_centers, duration=duration,
+                                     counter_color=counter_color, **sweep_style), self.static_background():
+                number = PathCounter(1, max_value=len(grid_moves), color=counter_color).scale(2).next_to(lgrid, DOWN, buff=0.5)
+                self.add(number)
+                self.play(path_sweep(lgrid, grid_moves, number, duration, **sweep_style))
 
         self.wait(1)
@@ -1,109 +1,25 @@
 from manim import *
-from itertools import permutations
-from manim.utils.color import interpolate_color
-
-def create_grid(slen, grid_dims):
-    """Create a square grid of squares with given side length and dimensions."""
-    return VGroup(*[
-        Square(side_length=slen).move_to(
-            np.array([
-                x * slen,
-                y * slen,
-                0
-            ])
-        )
-        for y in range(grid_dims)
-        for x in range(grid_dims)
-    ])
-
-
-# Convert moves to grid indices
-def add_move(curr, move):
-    x, y, z = curr + move
-    return x, y, z
-
-
-# Calculate direction vectors for offsetting
-def offset_point(p1, p2, amount):
-    direction = (p2 - p1)
-    direction[2] = 0
-    direction = direction / np.linalg.norm(direction)
-    return p1 + direction * amount
-
-
-def animate_line(lgrid, moves, snode, COLOUR=YELLOW, slen=2):
-    curr_pos = (0, 0, 0)
-    path_indices = []
-    grid_dims = int(np.sqrt(len(lgrid)))  # Assuming grid is square
-    for move in moves:
-        curr_pos = add_move(np.array(curr_pos), np.array(move))
-        x_idx, y_idx = int(curr_pos[1]), int(curr_pos[0])
-        idx =  y_idx * grid_dims + x_idx
-        path_indices.append(idx)
-    path_points = [lgrid[i].get_center() for i in path_indices]
-    
-    # Add snode.get_center() to all path_points
-    # for i in range(len(path_points)):
-    #     path_points[i] += snode.get_center()
-
-    # Offset amount (fraction of square side length)
-    offset_frac = 0.35
-    offset = slen * offset_frac
-
-    # Offset the first point towards the second, and the last towards the second-to-last
-    offset_points = [offset_point(path_points[0], path_points[1], offset)]
-    for i in range(1, len(path_points) - 2):
-        offset_points.append(path_points[i])
-    offset_points.append(offset_point(path_points[-2], path_points[-3], offset))
-
-    # Create lines between consecutive offset points
-    lines = VGroup(*[
-        Line(offset_points[i], offset_points[i + 1], color=COLOUR, stroke_width=8)
-        for i in range(len(offset_points) - 1)
-    ])
-    return lines
 
+from core.animations import TracePolyline
+from core.builders import create_grid
+from core.counting import count_paths
+from core.lattice_paths import get_all_moves
+from core.mobjects import level_of_detail
+from core.registry import SceneRegistry
+from core.tex_cache import DIGIT_LABELS, MATHDOTS_PREAMBLE, TexPrewarmMixin, make_tex_template, tex_labels
 
-def get_all_moves(lgrid_dims):
-    # Define paths for all permutations of moves between S and G
-    # These paths iterate through every perumtation of adding x, y in range (0, 3)
-    moves = []
-    for _ in range(lgrid_dims * lgrid_dims):
-        moves.append([(0, 0, 0)])  # Each list is a distinct object
-    
-    move_steps = [(1, 0, 0)] * (lgrid_dims - 1) + [(0, 1, 0)] * (lgrid_dims - 1)
-    all_paths = list(permutations(move_steps))
-    moves.clear()
-    for path in all_paths:
-        moves.append([(0, 0, 0)] + list(path))
-    for move in moves:
-        move.append((0, 0, 0))
-    
-    # Remove duplicate paths from moves
-    unique_moves = []
-    seen = set()
-    for move in moves:
-        move_tuple = tuple(move)
-        if move_tuple not in seen:
-            unique_moves.append(move)
-            seen.add(move_tuple)
-    moves = unique_moves
-    return moves
 
+class MultGridsZoomOutScene2D(TexPrewarmMixin, MovingCameraScene):
+    tex_manifest = (
+        tex_labels("$S$", "$G$", "3x3", "4x4", "5x5", "$NxN$", r"$\vdots$", r"$\dots$")
+        + tex_labels(*(f"{n}$\\times${n}" for n in range(6, 11)))
+        + tex_labels(r"$\iddots$", preamble=MATHDOTS_PREAMBLE)
+        + DIGIT_LABELS
+    )
 
-def get_unique_color(base_colors, i, total):
-            # Interpolate between base colors
-            idx = i * (len(base_colors) - 1) / max(1, total - 1)
-            low = int(idx)
-            high = min(low + 1, len(base_colors) - 1)
-            frac = idx - low
-            return interpolate_color(base_colors[low], base_colors[high], frac)
-   
-
-class MultGridsZoomOutScene2D(MovingCameraScene):
     def construct(self):
-        myTemplate = TexTemplate()
-        myTemplate.add_to_preamble(r"\usepackage{mathdots}")
+        # Same preamble as the manifest, so the \iddots label is a prewarmed cache hit
+        myTemplate = make_tex_template(MATHDOTS_PREAMBLE)
         
         slen = 2
         grid = create_grid(slen, 3)
@@ -116,7 +32,7 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
         # Highlight that these symmetries scale with grid size
         # Zoom out and shift grid to the far left, keeping it vertically centered
         frame = self.camera.frame
-        grid_width = slen * int(np.sqrt(len(grid)))
+        grid_width = slen * grid.grid_dims
         frame_width = frame.get_width()
         
         spacing = frame_width * 0.9 / (num_grids)
@@ -149,7 +65,11 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
         grid_label = Tex("3x3").scale(2).next_to(grid, UP, buff=0.5)
         grid_label2 = Tex("4x4").scale(2).next_to(grid2, UP, buff=0.5)
         grid_label3 = Tex("5x5").scale(2).next_to(grid3, UP, buff=0.5)
-        
+        # Each grid's label, counter and S/G markers, looked up by grid later on
+        registry = SceneRegistry()
+        registry.register(grid, label=grid_label, start=start_label, goal=goal_label)
+        registry.register(grid2, label=grid_label2, start=start_label2, goal=goal_label2)
+        registry.register(grid3, label=grid_label3, start=start_label3, goal=goal_label3)
         moves = get_all_moves(3)
         
         # Calculate new center: move grid to far left, keep vertical center
@@ -165,14 +85,17 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
         self.add(grid_label, grid_label2, grid_label3)
         self.add(start_label2, goal_label2, start_label3, goal_label3)
         
-        number = Integer(6, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
+        number = Integer(count_paths(3), color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
         self.add(number)
+        registry[grid].counter = number
         digit_width = Integer(1).scale(2).get_width()
-        number = Integer(20, color=BLUE_B).scale(2).next_to(grid2, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
+        number = Integer(count_paths(4), color=BLUE_B).scale(2).next_to(grid2, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
         self.add(number)
+        registry[grid2].counter = number
         digit_width = Integer(1).scale(2).get_width()
-        number = Integer(70, color=BLUE_B).scale(2).next_to(grid3, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
+        number = Integer(count_paths(5), color=BLUE_B).scale(2).next_to(grid3, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
         self.add(number)
+        registry[grid3].counter = number
 
         self.wait(1)
         
@@ -212,26 +135,27 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
             all_grids.append(new_grid)
         
         self.wait(1.5)
-        all_grid_labels = [grid_label, grid_label2, grid_label3]
         for i, grid in enumerate(all_grids):
             if i < 3:
                 continue
             self.add(grid)
             number = Text("?", color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
             self.add(number)
-            grid_label = Tex(f"{int(np.sqrt(len(grid)))}$\\times${int(np.sqrt(len(grid)))}", color=WHITE).scale(2).next_to(grid, UP, buff=0.5)
-            all_grid_labels.append(grid_label)
+            grid_label = Tex(f"{grid.grid_dims}$\\times${grid.grid_dims}", color=WHITE).scale(2).next_to(grid, UP, buff=0.5)
             self.add(grid_label)
+            registry.register(grid, label=grid_label, counter=number)
         
         left_x = (all_grids[0].get_left()[0] + all_grids[-1].get_right()[0]) / 2
         new_center = np.array([left_x, grid.get_center()[1], 0])
         total_width = all_grids[-1].get_right()[0] - all_grids[0].get_left()[0] + slen  # Add slen for padding
-        # Gradually speed up, then slow down at the end using rate_func
-        self.play(
-            frame.animate.set(width=total_width * 1.1).move_to(new_center),
-            run_time=2,
-            rate_func=lambda t: smooth(t, inflection=0.7)  # Much faster at start, snappier
-        )
+        # Grids drop to an outline only if zoomed out until their cells are a few pixels wide
+        with level_of_detail(self, all_grids):
+            # Gradually speed up, then slow down at the end using rate_func
+            self.play(
+                frame.animate.set(width=total_width * 1.1).move_to(new_center),
+                run_time=2,
+                rate_func=lambda t: smooth(t, inflection=0.7)  # Much faster at start, snappier
+            )
         
         self.wait(2)
         # Shift camera frame down so grids are near the top
@@ -248,39 +172,32 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
         for i, grid in enumerate(all_grids):
             # Find the number object below this grid
             if i == 0:
-                number = Integer(1, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
+                number = Integer(count_paths(3), color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
             elif i == 1:
-                number = Integer(20, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5).shift([-digit_width / 2, 0, 0])
+                number = Integer(count_paths(4), color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5).shift([-digit_width / 2, 0, 0])
             elif i == 2:
-                number = Integer(70, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5).shift([-digit_width / 2, 0, 0])
+                number = Integer(count_paths(5), color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5).shift([-digit_width / 2, 0, 0])
             else:
                 number = Text("?", color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
         
         # Fade out all grids except the first, second, and last, along with their grid_labels and numbers
         grids_to_fade = [g for i, g in enumerate(all_grids) if i not in (0, 1, len(all_grids) - 1)]
-        grid_labels_to_fade = []
-        numbers_to_fade = [
-            n for i, g in enumerate(all_grids)
-            for n in self.mobjects
-            if (isinstance(n, Text) or isinstance(n, Integer))
-            and n.get_center()[1] < g.get_bottom()[1]
-            and i not in [0, 1, len(all_grids) - 1]
-        ]
-        for i, g in enumerate(all_grids):
-            if i not in [0, 1, len(all_grids) - 1]:
-                # Find the grid label above this grid
-                label = next((m for m in self.mobjects if isinstance(m, Tex) and m.get_center()[0] == g.get_center()[0] and m.get_center()[1] > g.get_top()[1]), None)
-                if label:
-                    grid_labels_to_fade.append(label)
+        grid_labels_to_fade = registry.parts("label", grids_to_fade)
+        # New counters are added under the grids that stay, so every old one fades
+        numbers_to_fade = registry.parts("counter")
         # Remove grids at indices not in (0, 1, len(all_grids) - 1)
         for i in sorted([i for i in range(len(all_grids)) if i not in [0, 1, len(all_grids) - 1]], reverse=True):
             del all_grids[i]
-        number1 = Integer(6, color=BLUE_B).scale(2).next_to(all_grids[0], DOWN, buff=0.5)
-        number2 = Integer(20, color=BLUE_B).scale(2).next_to(all_grids[1], DOWN, buff=0.5)
+        number1 = Integer(count_paths(3), color=BLUE_B).scale(2).next_to(all_grids[0], DOWN, buff=0.5)
+        number2 = Integer(count_paths(4), color=BLUE_B).scale(2).next_to(all_grids[1], DOWN, buff=0.5)
         self.add(number1)
         self.add(number2)
         last_number = Text("?", color=BLUE_B).scale(2).next_to(all_grids[-1], DOWN, buff=0.5)
         self.add(last_number)
+        for g in grids_to_fade:
+            registry.unregister(g)
+        for g, counter in zip(all_grids, (number1, number2, last_number)):
+            registry[g].counter = counter
         # Fade out all numbers
         self.play(
             *[FadeOut(g) for g in grids_to_fade],
@@ -313,7 +230,7 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
             dot = Tex(r"$\dots$").scale(1.5).move_to(new_grid[idx].get_center())
             dots.append(dot)
         dots.append(Tex(r"$\iddots$", tex_template=myTemplate).scale(1.5).move_to(new_grid[n * n - 1].get_center()))
-        moved_label = all_grid_labels[-1]
+        moved_label = registry[moved_grid].label
         # Animate transition from moved_grid to new_grid
         self.play(
             Transform(moved_grid, new_grid),
@@ -328,10 +245,11 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
         new_center = np.array([(left_x + right_x) / 2, all_grids[0].get_center()[1], 0])
         total_width = right_x - left_x + slen  # Add slen for padding
 
-        self.play(
-            self.camera.frame.animate.set(width=total_width * 1.1).move_to(new_center),
-            run_time=1
-        )
+        with level_of_detail(self, all_grids):
+            self.play(
+                self.camera.frame.animate.set(width=total_width * 1.1).move_to(new_center),
+                run_time=1
+            )
         # Add dots to the scene
         self.play(*[FadeIn(dot) for dot in dots], run_time=0.5)
         
@@ -369,27 +287,7 @@ class MultGridsZoomOutScene2D(MovingCameraScene):
                 ]
                 animated_outline = VMobject()
                 animated_outline.set_stroke(color=YELLOW, width=10)
-                animated_outline.set_points_as_corners([corners[0], corners[0]])
-                self.add(animated_outline)
-                def update_outline(mob, alpha):
-                    n = len(corners) - 1
-                    total_length = sum(np.linalg.norm(corners[i+1] - corners[i]) for i in range(n))
-                    target_length = total_length * alpha
-                    points = [corners[0]]
-                    length = 0
-                    for i in range(n):
-                        seg = corners[i+1] - corners[i]
-                        seg_len = np.linalg.norm(seg)
-                        if length + seg_len < target_length:
-                            points.append(corners[i+1])
-                            length += seg_len
-                        else:
-                            remain = target_length - length
-                            if seg_len > 0:
-                                points.append(corners[i] + seg / seg_len * remain)
-                            break
-                    mob.set_points_as_corners(points)
-                self.play(UpdateFromAlphaFunc(animated_outline, update_outline), run_time=2)
+                self.play(TracePolyline(animated_outline, corners), run_time=2)
                 outline.set_stroke(opacity=1)
                 self.remove(animated_outline)
                 
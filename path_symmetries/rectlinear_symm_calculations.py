@@ -1,109 +1,21 @@
 from manim import *
-from itertools import permutations
-from manim.utils.color import interpolate_color
 
-def create_grid(slen, grid_dims):
-    """Create a square grid of squares with given side length and dimensions."""
-    return VGroup(*[
-        Square(side_length=slen).move_to(
-            np.array([
-                x * slen,
-                y * slen,
-                0
-            ])
-        )
-        for y in range(grid_dims)
-        for x in range(grid_dims)
-    ])
-
-
-# Convert moves to grid indices
-def add_move(curr, move):
-    x, y, z = curr + move
-    return x, y, z
-
-
-# Calculate direction vectors for offsetting
-def offset_point(p1, p2, amount):
-    direction = (p2 - p1)
-    direction[2] = 0
-    direction = direction / np.linalg.norm(direction)
-    return p1 + direction * amount
-
-
-def animate_line(lgrid, moves, snode, COLOUR=YELLOW, slen=2):
-    curr_pos = (0, 0, 0)
-    path_indices = []
-    grid_dims = int(np.sqrt(len(lgrid)))  # Assuming grid is square
-    for move in moves:
-        curr_pos = add_move(np.array(curr_pos), np.array(move))
-        x_idx, y_idx = int(curr_pos[1]), int(curr_pos[0])
-        idx =  y_idx * grid_dims + x_idx
-        path_indices.append(idx)
-    path_points = [lgrid[i].get_center() for i in path_indices]
-    
-    # Add snode.get_center() to all path_points
-    # for i in range(len(path_points)):
-    #     path_points[i] += snode.get_center()
-
-    # Offset amount (fraction of square side length)
-    offset_frac = 0.35
-    offset = slen * offset_frac
-
-    # Offset the first point towards the second, and the last towards the second-to-last
-    offset_points = [offset_point(path_points[0], path_points[1], offset)]
-    for i in range(1, len(path_points) - 2):
-        offset_points.append(path_points[i])
-    offset_points.append(offset_point(path_points[-2], path_points[-3], offset))
-
-    # Create lines between consecutive offset points
-    lines = VGroup(*[
-        Line(offset_points[i], offset_points[i + 1], color=COLOUR, stroke_width=8)
-        for i in range(len(offset_points) - 1)
-    ])
-    return lines
-
-
-def get_all_moves(lgrid_dims):
-    # Define paths for all permutations of moves between S and G
-    # These paths iterate through every perumtation of adding x, y in range (0, 3)
-    moves = []
-    for _ in range(lgrid_dims * lgrid_dims):
-        moves.append([(0, 0, 0)])  # Each list is a distinct object
-    
-    move_steps = [(1, 0, 0)] * (lgrid_dims - 1) + [(0, 1, 0)] * (lgrid_dims - 1)
-    all_paths = list(permutations(move_steps))
-    moves.clear()
-    for path in all_paths:
-        moves.append([(0, 0, 0)] + list(path))
-    for move in moves:
-        move.append((0, 0, 0))
-    
-    # Remove duplicate paths from moves
-    unique_moves = []
-    seen = set()
-    for move in moves:
-        move_tuple = tuple(move)
-        if move_tuple not in seen:
-            unique_moves.append(move)
-            seen.add(move_tuple)
-    moves = unique_moves
-    return moves
+from core.builders import create_grid
+from core.counting import count_paths
+from core.lattice_paths import get_all_moves
+from core.tex_cache import DIGIT_LABELS, MATHDOTS_PREAMBLE, TexPrewarmMixin, make_tex_template, tex_labels
 
 
-def get_unique_color(base_colors, i, total):
-            # Interpolate between base colors
-            idx = i * (len(base_colors) - 1) / max(1, total - 1)
-            low = int(idx)
-            high = min(low + 1, len(base_colors) - 1)
-            frac = idx - low
-            return interpolate_color(base_colors[low], base_colors[high], frac)
-   
+class SymmCalcsScene2D(TexPrewarmMixin, MovingCameraScene):
+    tex_manifest = (
+        tex_labels("$S$", "$G$", "3x3", "4x4", "NxN", r"$\vdots$", r"$\dots$", "Number of paths = ?")
+        + tex_labels(r"$\iddots$", preamble=MATHDOTS_PREAMBLE)
+        + DIGIT_LABELS
+    )
 
-class SymmCalcsScene2D(MovingCameraScene):
     def construct(self):
-        myTemplate = TexTemplate()
-        myTemplate.add_to_preamble(r"\usepackage{mathdots}")
+        # Same preamble as the manifest, so the \iddots label is a prewarmed cache hit
+        myTemplate = make_tex_template(MATHDOTS_PREAMBLE)
         
         slen = 2
         grid = create_grid(slen, 3)
@@ -163,9 +75,9 @@ class SymmCalcsScene2D(MovingCameraScene):
         self.add(grid_label, grid_label2, grid_label3)
         self.add(start_label2, goal_label2, start_label3, goal_label3)
         
-        number = Integer(6, color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
+        number = Integer(count_paths(3), color=BLUE_B).scale(2).next_to(grid, DOWN, buff=0.5)
         digit_width = Integer(1).scale(2).get_width()
-        number2 = Integer(20, color=BLUE_B).scale(2).next_to(grid2, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
+        number2 = Integer(count_paths(4), color=BLUE_B).scale(2).next_to(grid2, DOWN, buff=0.5).shift([- digit_width / 2, 0, 0])
         number3 = Text("?", color=BLUE_B).scale(2).next_to(grid3, DOWN, buff=0.5)
         self.add(number, number2, number3)
     
@@ -0,0 +1,79 @@
+"""Render every scene in path_symmetries across a process pool.
+
+Usage: python path_symmetries/render_all.py [-j WORKERS] [-q QUALITY] [--report FILE] [SCENE ...]
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manim import tempconfig
+from manim.constants import QUALITIES
+
+from core.scene_loader import find_scenes, load_module
+from core.tex_cache import prewarm_tex
+
+
+def render_scene(path, scene_name, quality):
+    """Render one scene in this process and return its report entry."""
+    start = time.perf_counter()
+    entry = {"module": path.stem, "scene": scene_name}
+    try:
+        scene_cls = getattr(load_module(path), scene_name)
+        with tempconfig({"quality": quality, "input_file": str(path), "preview": False, "progress_bar": "none"}):
+            scene = scene_cls()
+            scene.render()
+            entry["output"] = str(scene.renderer.file_writer.movie_file_path)
+        entry["status"] = "ok"
+    except Exception as exc:
+        entry["status"] = "failed"
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def render_all(scenes, workers=None, quality="low_quality"):
+    """Render ``scenes`` (``(path, name)`` pairs) on ``workers`` processes; return the report entries."""
+    # Compile every scene's labels up front so the workers don't race to compile the same ones
+    labels = []
+    for path, name in scenes:
+        labels.extend(getattr(getattr(load_module(path), name), "tex_manifest", ()))
+    prewarm_tex(labels, max_workers=workers)
+    report = []
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(render_scene, path, name, quality) for path, name in scenes]
+        for future in as_completed(futures):
+            entry = future.result()
+            print(f"{entry['status']:>6}  {entry['seconds']:8.2f}s  {entry['module']}.{entry['scene']}")
+            report.append(entry)
+    # Longest scenes first, which bound the wall-clock time of the batch
+    return sorted(report, key=lambda entry: -entry["seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names to render (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="number of render processes")
+    parser.add_argument("-q", "--quality", default="low_quality", choices=list(QUALITIES), help="manim quality preset")
+    parser.add_argument("--report", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    scenes = [(path, name) for path, name in find_scenes() if not args.scenes or name in args.scenes]
+    start = time.perf_counter()
+    report = render_all(scenes, workers=args.workers, quality=args.quality)
+    summary = {
+        "quality": args.quality,
+        "workers": args.workers,
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "scenes": report,
+    }
+    print(f"Rendered {sum(e['status'] == 'ok' for e in report)}/{len(report)} scenes in {summary['wall_seconds']:.2f}s")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0 if all(e["status"] == "ok" for e in report) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())